@@ -0,0 +1,119 @@
+// Minimal benchmarking harness: time-based warmup, calibrated samples,
+// ops/s as the median sample with a distribution-free 95% confidence interval
+// (a few slow samples from GC or a busy machine do not move it the way they
+// move a mean), and an estimate of bytes allocated per operation (needs
+// --expose-gc; it is the median heap growth over several batches).
+
+// Two-sided 95% Student t critical values by degrees of freedom
+const T95 = [12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228, 2.201, 2.179, 2.16, 2.145, 2.131, 2.12, 2.11, 2.101, 2.093, 2.086];
+
+function tCritical(df) {
+  return df <= T95.length ? T95[df - 1] : 1.96;
+}
+
+// Index of the lower bound of a 95% confidence interval for the median of n
+// sorted samples: the largest k with P(Binomial(n, 1/2) < k) <= 0.025. The
+// upper bound is the mirror index. Too few samples for any k gives the range.
+function medianBoundIndex(n) {
+  let k = 0;
+  let cdf = 0;
+  let term = Math.pow(0.5, n);
+  for (let i = 0; i < n; i++) {
+    cdf += term;
+    if (cdf > 0.025) break;
+    k = i + 1;
+    term = (term * (n - i)) / (i + 1);
+  }
+  return k;
+}
+
+function median(sorted) {
+  const mid = sorted.length >> 1;
+  return sorted.length % 2 ? sorted[mid] : (sorted[mid - 1] + sorted[mid]) / 2;
+}
+
+function now() {
+  return Number(process.hrtime.bigint()) / 1e6;
+}
+
+// Seeded PRNG (mulberry32) so inputs are identical from run to run
+function rng(seed = 42) {
+  let a = seed >>> 0;
+  return function () {
+    a = (a + 0x6d2b79f5) >>> 0;
+    let t = a;
+    t = Math.imul(t ^ (t >>> 15), t | 1);
+    t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+}
+
+// Results are kept here so the optimiser cannot drop the benchmarked call
+let sinkValue;
+
+function timeBatch(fn, args, iterations) {
+  const start = now();
+  for (let i = 0; i < iterations; i++) sinkValue = fn(...args);
+  return now() - start;
+}
+
+function heapGrowth(fn, args, iterations) {
+  global.gc();
+  const before = process.memoryUsage().heapUsed;
+  timeBatch(fn, args, iterations);
+  return (process.memoryUsage().heapUsed - before) / iterations;
+}
+
+// Heap accounting is coarse, so small allocations need a larger batch to show
+// up; the batch is only grown while it stays well inside the young generation.
+// A single batch can be inflated by lazily allocated code and feedback or
+// deflated by a collection, so the median of several batches is reported.
+function measureAllocation(fn, args, trials = 5) {
+  if (typeof global.gc !== 'function') return null;
+  const iterations = heapGrowth(fn, args, 16) * 1024 < 8 * 1024 * 1024 ? 1024 : 16;
+  const growth = [];
+  for (let t = 0; t < trials; t++) growth.push(heapGrowth(fn, args, iterations));
+  return Math.max(0, Math.round(median(growth.sort((a, b) => a - b))));
+}
+
+function run(fn, args, options = {}) {
+  const { warmupMs = 100, sampleMs = 50, samples = 20 } = options;
+
+  // Warm up, doubling the batch while it is shorter than a sample
+  let iterations = 1;
+  const warmEnd = now() + warmupMs;
+  while (now() < warmEnd) {
+    if (timeBatch(fn, args, iterations) < sampleMs) iterations *= 2;
+  }
+
+  // Size the batch again from warm timings. The first calls may have paid for
+  // one-time initialisation, and calibrating on them would leave every sample
+  // a single call. Each size is timed twice and the faster run counts, so a
+  // single pause cannot end the calibration early either.
+  iterations = 1;
+  while (Math.min(timeBatch(fn, args, iterations), timeBatch(fn, args, iterations)) < sampleMs) iterations *= 2;
+
+  const rates = [];
+  for (let s = 0; s < samples; s++) {
+    const elapsed = timeBatch(fn, args, iterations);
+    rates.push((iterations * 1000) / Math.max(elapsed, 1e-6));
+  }
+  rates.sort((a, b) => a - b);
+  const mean = rates.reduce((a, b) => a + b, 0) / rates.length;
+  const variance = rates.reduce((a, r) => a + (r - mean) * (r - mean), 0) / Math.max(1, rates.length - 1);
+  const margin = (tCritical(rates.length - 1) * Math.sqrt(variance)) / Math.sqrt(rates.length);
+  const k = medianBoundIndex(rates.length);
+
+  return {
+    ops: median(rates),
+    low: rates[Math.max(0, k - 1)],
+    high: rates[Math.min(rates.length - 1, rates.length - k)],
+    mean,
+    rme: mean ? (margin / mean) * 100 : 0,
+    bytesPerOp: measureAllocation(fn, args),
+    samples: rates.length,
+    iterations,
+  };
+}
+
+module.exports = { run, rng, tCritical, medianBoundIndex };
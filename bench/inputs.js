@@ -0,0 +1,36 @@
+// Deterministic input generators shared by the benchmark suites.
+
+function ints(n, rand, max = 1000) {
+  return Array.from({ length: n }, () => Math.floor(rand() * max));
+}
+
+function floats(n, rand) {
+  return Array.from({ length: n }, () => rand() * 1000);
+}
+
+function sorted(n, rand, max) {
+  return ints(n, rand, max).sort((a, b) => a - b);
+}
+
+const WORDS = ['alpha', 'Beta', 'gamma_ray', 'delta-force', 'Epsilon', 'zeta', 'etaTheta', 'iota', 'kappa', 'LAMBDA'];
+
+function words(n, rand) {
+  return Array.from({ length: n }, () => WORDS[Math.floor(rand() * WORDS.length)]);
+}
+
+// Roughly n characters of mixed-case, punctuated text
+function text(n, rand) {
+  let s = '';
+  while (s.length < n) s += words(1, rand)[0] + (rand() < 0.2 ? '  ' : ' ') + (rand() < 0.1 ? '<b>x</b> ' : '');
+  return s.slice(0, n);
+}
+
+function nested(n, rand) {
+  return Array.from({ length: n }, (_, i) => (i % 3 ? [i, [i + 1]] : Math.floor(rand() * 100)));
+}
+
+function records(n, rand) {
+  return Array.from({ length: n }, (_, i) => ({ id: i, group: 'g' + Math.floor(rand() * 20) }));
+}
+
+module.exports = { ints, floats, sorted, words, text, nested, records };
@@ -0,0 +1,124 @@
+// Runs every benchmark suite in bench/suites and compares the results with
+// bench/baseline.json.
+//
+//   node --expose-gc bench/run.js                 compare, exit 1 on regression
+//   node --expose-gc bench/run.js --update        rewrite the baseline
+//   node --expose-gc bench/run.js --filter=array  only matching cases
+//   node --expose-gc bench/run.js --tolerance=0.3 allowed slowdown (default 0.5)
+//
+// Throughput is the median of 20 samples of ~50ms each. A case regresses when
+// the upper bound of the 95% confidence interval for that median is below
+// baseline * (1 - tolerance), so one or two samples stalled by GC or another
+// process cannot flag it. The tolerance is deliberately wide since
+// baselines are recorded on one machine and compared on another; it exists to
+// catch order-of-magnitude slowdowns, not small drifts.
+const fs = require('fs');
+const path = require('path');
+const harness = require('./harness');
+
+const ROOT = path.join(__dirname, '..');
+const SUITES_DIR = path.join(__dirname, 'suites');
+const BASELINE = path.join(__dirname, 'baseline.json');
+
+function parseArgs(argv) {
+  const opts = { update: false, filter: '', tolerance: Number(process.env.BENCH_TOLERANCE) || 0.5 };
+  for (const arg of argv) {
+    if (arg === '--update') opts.update = true;
+    else if (arg.startsWith('--filter=')) opts.filter = arg.slice(9);
+    else if (arg.startsWith('--tolerance=')) opts.tolerance = Number(arg.slice(12));
+    else throw new Error('unknown argument: ' + arg);
+  }
+  return opts;
+}
+
+function loadSuites() {
+  return fs
+    .readdirSync(SUITES_DIR)
+    .filter((f) => f.endsWith('.js'))
+    .sort()
+    .map((f) => {
+      const suite = require(path.join(SUITES_DIR, f));
+      return { name: path.basename(f, '.js'), exports: require(path.join(ROOT, suite.module)), ...suite };
+    });
+}
+
+// Every exported function needs a case named after it
+function missingCases(suites) {
+  const missing = [];
+  for (const suite of suites) {
+    for (const [name, value] of Object.entries(suite.exports)) {
+      if (typeof value === 'function' && !suite.cases[name]) missing.push(`${suite.module}.${name}`);
+    }
+  }
+  return missing;
+}
+
+function expand(suite) {
+  const out = [];
+  for (const [name, spec] of Object.entries(suite.cases)) {
+    const { sizes = suite.sizes, args, invoke } = typeof spec === 'function' ? { args: spec } : spec;
+    for (const n of sizes) {
+      out.push({
+        key: `${suite.name}.${name}[${n}]`,
+        fn: invoke ? invoke(suite.exports) : suite.exports[name],
+        args: () => args(n, harness.rng(n)),
+      });
+    }
+  }
+  return out;
+}
+
+function fmt(n, digits = 0) {
+  return Number.isFinite(n) ? n.toLocaleString('en-US', { maximumFractionDigits: digits }) : '-';
+}
+
+function main() {
+  const opts = parseArgs(process.argv.slice(2));
+  const suites = loadSuites();
+  const missing = missingCases(suites);
+  if (missing.length) {
+    console.error('Exports without a benchmark case:\n  ' + missing.join('\n  '));
+    process.exit(2);
+  }
+  if (typeof global.gc !== 'function') console.warn('Run with --expose-gc to report bytes/op.');
+
+  const baseline = fs.existsSync(BASELINE) ? JSON.parse(fs.readFileSync(BASELINE, 'utf8')) : { results: {} };
+  const results = {};
+  const regressions = [];
+
+  console.log(`${'case'.padEnd(44)} ${'ops/s'.padStart(14)} ${'±%'.padStart(7)} ${'B/op'.padStart(10)} ${'baseline'.padStart(14)} ${'Δ%'.padStart(8)}`);
+  for (const suite of suites) {
+    for (const c of expand(suite)) {
+      if (opts.filter && !c.key.includes(opts.filter)) continue;
+      const r = harness.run(c.fn, c.args());
+      results[c.key] = { ops: Math.round(r.ops), rme: Number(r.rme.toFixed(2)), bytesPerOp: r.bytesPerOp };
+
+      const base = baseline.results[c.key];
+      let delta = '';
+      if (base) {
+        delta = (((r.ops - base.ops) / base.ops) * 100).toFixed(1);
+        if (r.high < base.ops * (1 - opts.tolerance)) regressions.push(c.key);
+      }
+      const flag = regressions[regressions.length - 1] === c.key ? '  REGRESSION' : '';
+      console.log(
+        `${c.key.padEnd(44)} ${fmt(r.ops).padStart(14)} ${r.rme.toFixed(1).padStart(7)} ${fmt(r.bytesPerOp).padStart(10)} ${fmt(base && base.ops).padStart(14)} ${delta.padStart(8)}${flag}`
+      );
+    }
+  }
+
+  if (opts.update) {
+    const merged = opts.filter ? { ...baseline.results, ...results } : results;
+    const sortedResults = Object.fromEntries(Object.keys(merged).sort().map((k) => [k, merged[k]]));
+    fs.writeFileSync(BASELINE, JSON.stringify({ node: process.version, results: sortedResults }, null, 2) + '\n');
+    console.log(`Baseline written to ${path.relative(ROOT, BASELINE)}`);
+    return;
+  }
+  if (regressions.length) {
+    console.error(`\n${regressions.length} regression(s) beyond ${opts.tolerance * 100}% tolerance:\n  ${regressions.join('\n  ')}`);
+    process.exit(1);
+  }
+}
+
+if (require.main === module) main();
+
+module.exports = { loadSuites, missingCases, expand };
@@ -0,0 +1,33 @@
+const { ints, floats, sorted, words, nested, records } = require('../inputs');
+
+module.exports = {
+  module: 'server/utils/array',
+  sizes: [100, 10000],
+  cases: {
+    uniq: (n, r) => [ints(n, r, n / 2)],
+    flatten: (n, r) => [nested(n, r)],
+    chunk: (n, r) => [ints(n, r), 16],
+    groupBy: (n, r) => [records(n, r), (x) => x.group],
+    partition: (n, r) => [ints(n, r), (x) => x % 2 === 0],
+    zip: (n, r) => [ints(n, r), ints(n, r)],
+    unzip: (n, r) => [ints(n, r).map((x) => [x, x + 1])],
+    range: (n) => [n],
+    intersect: (n, r) => [ints(n, r), ints(n, r)],
+    difference: (n, r) => [ints(n, r), ints(n, r)],
+    shuffle: (n, r) => [ints(n, r)],
+    sum: (n, r) => [floats(n, r)],
+    average: (n, r) => [floats(n, r)],
+    median: (n, r) => [floats(n, r)],
+    mode: (n, r) => [ints(n, r, 50)],
+    rotate: (n, r) => [ints(n, r), 7],
+    take: (n, r) => [ints(n, r), n >> 1],
+    drop: (n, r) => [ints(n, r), n >> 1],
+    compact: (n, r) => [ints(n, r, 3)],
+    mapObj: (n, r) => [words(n, r), (w) => [w, w.length]],
+    keyBy: (n, r) => [records(n, r), (x) => x.id],
+    permutations: { sizes: [5, 8], args: (n, r) => [ints(n, r)] },
+    combinations: { sizes: [10, 20], args: (n, r) => [ints(n, r), 3] },
+    slidingWindow: (n, r) => [ints(n, r), 8],
+    binarySearch: (n, r) => [sorted(n, r, n * 4), Math.floor(r() * n * 4)],
+  },
+};
@@ -0,0 +1,17 @@
+const { floats } = require('../inputs');
+
+module.exports = {
+  module: 'server/services/calculator',
+  sizes: [100, 10000],
+  cases: {
+    factorial: { sizes: [20, 100000], args: (n) => [n] },
+    fibonacci: { sizes: [50, 100000], args: (n) => [n] },
+    gcd: { sizes: [1], args: () => [1071 * 832040, 462 * 514229] },
+    lcm: { sizes: [1], args: () => [21 * 832040, 6 * 514229] },
+    prime: { sizes: [97, 999983], args: (n) => [n] },
+    primesUpTo: { sizes: [1000, 1000000], args: (n) => [n] },
+    mean: (n, r) => [floats(n, r)],
+    variance: (n, r) => [floats(n, r)],
+    stddev: (n, r) => [floats(n, r)],
+  },
+};
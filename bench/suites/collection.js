@@ -0,0 +1,28 @@
+const { ints, floats, sorted, nested, records } = require('../inputs');
+
+module.exports = {
+  module: 'server/utils/collection',
+  sizes: [100, 10000],
+  cases: {
+    isNumericArray: (n, r) => [floats(n, r)],
+    flatten: (n, r) => [nested(n, r)],
+    flattenDepth: (n, r) => [nested(n, r), Infinity],
+    intersectSorted: (n, r) => [sorted(n, r, n * 2), sorted(n, r, n * 2)],
+    differenceSorted: (n, r) => [sorted(n, r, n * 2), sorted(n, r, n * 2)],
+    unionSorted: (n, r) => [sorted(n, r, n * 2), sorted(n, r, n * 2)],
+    membership: (n, r) => [ints(n, r)],
+    groupByMap: (n, r) => [records(n, r), (x) => x.group],
+    keyByMap: (n, r) => [records(n, r), (x) => x.id],
+    View: {
+      args: (n, r) => [ints(n, r)],
+      invoke: ({ View }) => (arr) => new View(arr, 1).toArray(),
+    },
+    takeView: (n, r) => [ints(n, r), n >> 1],
+    dropView: (n, r) => [ints(n, r), n >> 1],
+    rotateView: (n, r) => [ints(n, r), 7],
+    toFloat64: (n, r) => [floats(n, r)],
+    sumNumeric: (n, r) => [Float64Array.from(floats(n, r))],
+    averageNumeric: (n, r) => [Float64Array.from(floats(n, r))],
+    medianNumeric: (n, r) => [floats(n, r)],
+  },
+};
@@ -0,0 +1,23 @@
+const d = new Date(2024, 1, 29, 13, 45, 7);
+
+module.exports = {
+  module: 'server/utils/date',
+  sizes: [1],
+  cases: {
+    pad: () => [7],
+    formatISO: () => [d],
+    formatYMD: () => [d],
+    formatHMS: () => [d],
+    addDays: () => [d, 45],
+    addMonths: () => [d, 13],
+    addYears: () => [d, 3],
+    startOfDay: () => [d],
+    endOfDay: () => [d],
+    diffDays: () => [d, new Date(2025, 6, 4)],
+    isLeapYear: () => [2024],
+    daysInMonth: () => [2024, 2],
+    parseYMD: () => ['2024-02-29'],
+    isValidDate: () => [d],
+    toTimezone: () => [d, 330],
+  },
+};
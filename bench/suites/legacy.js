@@ -0,0 +1,12 @@
+// Before/after comparison for the collection engine: each case reuses the
+// array suite's sizes and inputs, so legacy.<name>[n] lines up with
+// array.<name>[n] in the report.
+const array = require('./array');
+
+const names = ['flatten', 'groupBy', 'intersect', 'difference', 'median', 'rotate'];
+
+module.exports = {
+  module: 'bench/legacy',
+  sizes: array.sizes,
+  cases: Object.fromEntries(names.map((name) => [name, array.cases[name]])),
+};
@@ -0,0 +1,9 @@
+module.exports = {
+  module: 'server/utils/math',
+  sizes: [1],
+  cases: {
+    add: () => [2, 3],
+    mul: () => [6, 7],
+    safeDivide: () => [22, 7],
+  },
+};
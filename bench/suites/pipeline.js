@@ -0,0 +1,28 @@
+const { text } = require('../inputs');
+
+const CHAIN = ['normalizeWhitespace', 'toKebabCase', 'slugify'];
+
+module.exports = {
+  module: 'server/utils/pipeline',
+  sizes: [32, 4096],
+  cases: {
+    compile: { sizes: [1], args: () => [CHAIN] },
+    'compile:run': {
+      args: (n, r) => [text(n, r)],
+      invoke: ({ compile }) => compile(CHAIN, { cacheSize: 0 }),
+    },
+    'compile:cached': {
+      args: (n, r) => [text(n, r)],
+      invoke: ({ compile }) => compile(CHAIN),
+    },
+    LRU: {
+      sizes: [100, 10000],
+      args: (n) => [Array.from({ length: n }, (_, i) => 'k' + (i % 700))],
+      invoke: ({ LRU }) => (keys) => {
+        const cache = new LRU(512);
+        for (const k of keys) if (cache.get(k) === undefined) cache.set(k, k);
+        return cache.size;
+      },
+    },
+  },
+};
@@ -0,0 +1,36 @@
+const { text, words } = require('../inputs');
+
+module.exports = {
+  module: 'server/utils/string',
+  sizes: [32, 4096],
+  cases: {
+    capitalize: (n, r) => [text(n, r)],
+    toCamelCase: (n, r) => [text(n, r)],
+    toKebabCase: (n, r) => [text(n, r)],
+    toSnakeCase: (n, r) => [text(n, r)],
+    padLeft: (n) => ['abc', n],
+    padRight: (n) => ['abc', n],
+    truncate: (n, r) => [text(n, r), n >> 1],
+    repeat: (n) => ['ab', n],
+    reverse: (n, r) => [text(n, r)],
+    contains: (n, r) => [text(n, r), 'zz'],
+    startsWithAny: (n, r) => [text(n, r), words(8, r)],
+    endsWithAny: (n, r) => [text(n, r), words(8, r)],
+    countOccurrences: (n, r) => [text(n, r), 'a'],
+    stripTags: (n, r) => [text(n, r)],
+    isBlank: (n) => [' '.repeat(n)],
+    normalizeWhitespace: (n, r) => [text(n, r)],
+    safeJsonParse: (n, r) => [JSON.stringify(words(n >> 3, r))],
+    toTitleCase: (n, r) => [text(n, r)],
+    mask: (n, r) => [text(n, r)],
+    levenshtein: { sizes: [16, 256], args: (n, r) => [text(n, r), text(n, r)] },
+    wrap: (n, r) => [text(n, r), 40],
+    chunk: (n, r) => [text(n, r), 8],
+    between: (n, r) => ['[' + text(n, r) + ']', '[', ']'],
+    ensurePrefix: (n, r) => [text(n, r), 'pre-'],
+    ensureSuffix: (n, r) => [text(n, r), '-suf'],
+    replaceAll: (n, r) => [text(n, r), 'a', 'A'],
+    removeNonAscii: (n, r) => [text(n, r) + '\u0085\u0007'],
+    slugify: (n, r) => [text(n, r)],
+  },
+};
@@ -0,0 +1,6 @@
+"""Python client for the /api and /adv endpoints of the MERN training server."""
+
+from .client import ApiError, Client
+from .aio import AsyncClient
+
+__all__ = ["ApiError", "AsyncClient", "Client"]
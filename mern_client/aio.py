@@ -0,0 +1,79 @@
+"""asyncio interface on top of the pooled :class:`Client`.
+
+Calls run on the client's thread pool, so they share its keep-alive
+connections; ``gather`` fans a set of calls out concurrently.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+from typing import Any, Awaitable, Iterable, List, Optional, Sequence
+
+from .client import Client
+
+
+class AsyncClient:
+    """Wraps ``client``, or a new :class:`Client` built from ``kwargs``.
+
+    Closing only closes a client this wrapper created; a client passed in
+    stays open for its owner.
+    """
+
+    def __init__(self, client: Optional[Client] = None, **kwargs: Any) -> None:
+        self._owns_client = client is None
+        self.client = client if client is not None else Client(**kwargs)
+
+    async def __aenter__(self) -> "AsyncClient":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        if self._owns_client:
+            await asyncio.get_running_loop().run_in_executor(None, self.client.close)
+
+    async def _run(self, name: str, *args: Any, **kwargs: Any) -> Any:
+        fn = functools.partial(getattr(self.client, name), *args, **kwargs)
+        return await asyncio.get_running_loop().run_in_executor(self.client.executor, fn)
+
+    @staticmethod
+    async def gather(calls: Iterable[Awaitable[Any]]) -> List[Any]:
+        return list(await asyncio.gather(*calls))
+
+    async def get(self, path: str, **kwargs: Any):
+        return await self._run("get", path, **kwargs)
+
+    async def post(self, path: str, **kwargs: Any):
+        return await self._run("post", path, **kwargs)
+
+    async def add(self, a: float, b: float) -> float:
+        return await self._run("add", a, b)
+
+    async def mul(self, a: float, b: float) -> float:
+        return await self._run("mul", a, b)
+
+    async def divide(self, a: float, b: float) -> float:
+        return await self._run("divide", a, b)
+
+    async def transform(self, steps: Sequence[str], inputs: Sequence[str]) -> List[str]:
+        return await self._run("transform", steps, inputs)
+
+    async def transform_one(self, steps: Sequence[str], value: str) -> str:
+        return await asyncio.wrap_future(self.client.submit_transform(steps, value))
+
+    async def factorial(self, n: int) -> float:
+        return await self._run("factorial", n)
+
+    async def fibonacci(self, n: int) -> float:
+        return await self._run("fibonacci", n)
+
+    async def gcd(self, a: int, b: int) -> int:
+        return await self._run("gcd", a, b)
+
+    async def lcm(self, a: int, b: int) -> int:
+        return await self._run("lcm", a, b)
+
+    async def primes(self, n: int) -> List[int]:
+        return await self._run("primes", n)
@@ -0,0 +1,78 @@
+"""Client-side coalescing of many small calls into batched requests."""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, List, Sequence, Tuple
+
+
+class Batcher:
+    """Collects items per key and flushes them together.
+
+    ``flush(key, items)`` must return one result per item, in order. A batch is
+    sent when it reaches ``max_size`` items or ``window`` seconds after its
+    first item arrived, whichever comes first.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[Hashable, Sequence[Any]], Sequence[Any]],
+        window: float = 0.005,
+        max_size: int = 1000,
+    ) -> None:
+        self._flush = flush
+        self._window = window
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._pending: Dict[Hashable, List[Tuple[Any, Future]]] = {}
+        self._timers: Dict[Hashable, threading.Timer] = {}
+
+    def submit(self, key: Hashable, item: Any) -> Future:
+        fut: Future = Future()
+        ready = None
+        with self._lock:
+            batch = self._pending.setdefault(key, [])
+            batch.append((item, fut))
+            if len(batch) >= self._max_size:
+                ready = self._take(key)
+            elif key not in self._timers:
+                timer = threading.Timer(self._window, self._on_timer, args=(key,))
+                timer.daemon = True
+                self._timers[key] = timer
+                timer.start()
+        if ready:
+            self._send(key, ready)
+        return fut
+
+    def flush(self) -> None:
+        """Sends every pending batch now."""
+        with self._lock:
+            batches = [(key, self._take(key)) for key in list(self._pending)]
+        for key, batch in batches:
+            self._send(key, batch)
+
+    def _take(self, key: Hashable) -> List[Tuple[Any, Future]]:
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        return self._pending.pop(key, [])
+
+    def _on_timer(self, key: Hashable) -> None:
+        with self._lock:
+            self._timers.pop(key, None)
+            batch = self._pending.pop(key, [])
+        if batch:
+            self._send(key, batch)
+
+    def _send(self, key: Hashable, batch: List[Tuple[Any, Future]]) -> None:
+        try:
+            results = self._flush(key, [item for item, _ in batch])
+            if len(results) != len(batch):
+                raise RuntimeError("batch returned %d results for %d items" % (len(results), len(batch)))
+        except BaseException as exc:  # propagate to every waiter
+            for _, fut in batch:
+                fut.set_exception(exc)
+            return
+        for (_, fut), result in zip(batch, results):
+            fut.set_result(result)
@@ -0,0 +1,182 @@
+"""Pooled, retrying HTTP client with typed methods for every endpoint."""
+
+from __future__ import annotations
+
+import random
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, TypeVar
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .batching import Batcher
+
+T = TypeVar("T")
+
+DEFAULT_BASE = "http://localhost:3000"
+
+
+class ApiError(Exception):
+    """Non-2xx response; ``error`` is the server's ``{"error": ...}`` value."""
+
+    def __init__(self, status: int, error: Any, response: requests.Response) -> None:
+        super().__init__("HTTP %d: %s" % (status, error))
+        self.status = status
+        self.error = error
+        self.response = response
+
+
+class Client:
+    """Thread-safe client sharing one keep-alive connection pool.
+
+    ``get``/``post`` mirror ``requests.get``/``requests.post`` (absolute URLs
+    or paths relative to ``base_url``), so code written against ``requests``
+    can switch to a client unchanged. Responses with status 503 are retried
+    with exponential backoff, honouring ``Retry-After``.
+    """
+
+    def __init__(
+        self,
+        base_url: str = DEFAULT_BASE,
+        timeout: float = 5.0,
+        pool_size: int = 16,
+        retries: int = 3,
+        backoff: float = 0.1,
+        max_workers: int = 8,
+        batch_window: float = 0.005,
+        batch_size: int = 1000,
+    ) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._transforms = Batcher(self._flush_transforms, window=batch_window, max_size=batch_size)
+
+    # -- plumbing -----------------------------------------------------------
+
+    def close(self) -> None:
+        self._transforms.flush()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self.session.close()
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def _url(self, path: str) -> str:
+        if path.startswith(("http://", "https://")):
+            return path
+        return self.base_url + ("" if path.startswith("/") else "/") + path
+
+    def _delay(self, attempt: int, resp: requests.Response) -> float:
+        retry_after = resp.headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                pass
+        return self.backoff * (2 ** attempt) * (0.5 + random.random() / 2)
+
+    def request(self, method: str, path: str, **kwargs: Any) -> requests.Response:
+        kwargs.setdefault("timeout", self.timeout)
+        url = self._url(path)
+        attempt = 0
+        while True:
+            resp = self.session.request(method, url, **kwargs)
+            if resp.status_code != 503 or attempt >= self.retries:
+                return resp
+            time.sleep(self._delay(attempt, resp))
+            attempt += 1
+
+    def get(self, path: str, params: Optional[Dict[str, Any]] = None, **kwargs: Any) -> requests.Response:
+        return self.request("GET", path, params=params, **kwargs)
+
+    def post(self, path: str, json: Any = None, **kwargs: Any) -> requests.Response:
+        return self.request("POST", path, json=json, **kwargs)
+
+    def _call(self, method: str, path: str, key: str = "result", **kwargs: Any) -> Any:
+        resp = self.request(method, path, **kwargs)
+        try:
+            body = resp.json()
+        except ValueError:
+            body = None
+        if not resp.ok:
+            raise ApiError(resp.status_code, body.get("error") if isinstance(body, dict) else resp.text, resp)
+        return body[key]
+
+    # -- concurrency --------------------------------------------------------
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="mern-client")
+        return self._executor
+
+    def submit(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> "Future[T]":
+        return self.executor.submit(fn, *args, **kwargs)
+
+    def map(self, fn: Callable[..., T], *iterables: Iterable[Any]) -> List[T]:
+        """Runs ``fn`` over the arguments concurrently, results in order."""
+        return list(self.executor.map(fn, *iterables))
+
+    def fan_out(self, calls: Iterable[Callable[[], T]]) -> List[T]:
+        """Runs zero-argument callables concurrently, results in order."""
+        futures = [self.executor.submit(call) for call in calls]
+        return [f.result() for f in futures]
+
+    # -- /api ---------------------------------------------------------------
+
+    def add(self, a: float, b: float) -> float:
+        return self._call("GET", "/api/add", params={"a": a, "b": b})
+
+    def mul(self, a: float, b: float) -> float:
+        return self._call("GET", "/api/mul", params={"a": a, "b": b})
+
+    def divide(self, a: float, b: float) -> float:
+        return self._call("GET", "/api/divide", params={"a": a, "b": b})
+
+    def transform(self, steps: Sequence[str], inputs: Sequence[str]) -> List[str]:
+        return self._call("POST", "/api/transform", key="results", json={"steps": list(steps), "inputs": list(inputs)})
+
+    def submit_transform(self, steps: Sequence[str], value: str) -> "Future[str]":
+        """Queues one string; concurrent calls with the same steps share a request."""
+        return self._transforms.submit(tuple(steps), value)
+
+    def transform_one(self, steps: Sequence[str], value: str) -> str:
+        return self.submit_transform(steps, value).result()
+
+    def _flush_transforms(self, steps: Any, inputs: Sequence[str]) -> List[str]:
+        return self.transform(steps, inputs)
+
+    # -- /adv ---------------------------------------------------------------
+
+    def factorial(self, n: int) -> float:
+        return self._call("GET", "/adv/factorial", params={"n": n})
+
+    def fibonacci(self, n: int) -> float:
+        return self._call("GET", "/adv/fibonacci", params={"n": n})
+
+    def gcd(self, a: int, b: int) -> int:
+        return self._call("GET", "/adv/gcd", params={"a": a, "b": b})
+
+    def lcm(self, a: int, b: int) -> int:
+        return self._call("GET", "/adv/lcm", params={"a": a, "b": b})
+
+    def primes(self, n: int) -> List[int]:
+        return self._call("GET", "/adv/primes", params={"n": n})
+
+    def health(self) -> Dict[str, Any]:
+        resp = self.get("/health")
+        resp.raise_for_status()
+        return resp.json()
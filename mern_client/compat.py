@@ -0,0 +1,32 @@
+"""Drop-in for the ``requests.get``/``requests.post`` calls in the task suites.
+
+``from mern_client import compat as requests`` routes those calls through one
+shared pooled :class:`Client` (keep-alive connections, retry on 503).
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from typing import Any, Optional
+
+from .client import DEFAULT_BASE, Client
+
+_lock = threading.Lock()
+_client: Optional[Client] = None
+
+
+def client() -> Client:
+    global _client
+    with _lock:
+        if _client is None:
+            _client = Client(base_url=os.environ.get("MERN_BASE_URL", DEFAULT_BASE))
+        return _client
+
+
+def get(url: str, params: Any = None, **kwargs: Any):
+    return client().get(url, params=params, **kwargs)
+
+
+def post(url: str, json: Any = None, **kwargs: Any):
+    return client().post(url, json=json, **kwargs)
@@ -1,13 +1,31 @@
 const express = require('express');
 const path = require('path');
+const profiler = require('./services/profiler');
+
+// Before the routers load, so the calculator functions they pick up can be
+// timed from /admin/timing. Without an admin token nobody can read the
+// timings, so nothing is wrapped.
+if (process.env.ADMIN_TOKEN) profiler.instrument();
+
 const api = require('./routes/api');
 const adv = require('./routes/advanced');
+const admin = require('./routes/admin');
+const jobs = require('./routes/jobs');
+const tables = require('./services/tables');
+const { coalesce } = require('./middleware/coalesce');
 
 const app = express();
+// Mounted ahead of the shared body parser: /api/transform parses its own
+// batch bodies with a larger limit than the default below.
+app.use('/api', api);
+
 app.use(express.json());
 
-app.use('/api', api);
+// Identical concurrent requests for the expensive endpoints share one answer
+app.use('/adv', coalesce(['/factorial', '/fibonacci', '/primes']));
 app.use('/adv', adv);
+app.use('/admin', admin);
+app.use('/jobs', jobs);
 
 // Serve static client
 app.use(express.static(path.join(__dirname, '..', 'client')));
@@ -19,6 +37,10 @@ app.get('/health', (_req, res) => {
 
 const PORT = process.env.PORT || 3000;
 if (require.main === module) {
+  // Load (or build and persist) the lookup tables before taking traffic
+  const started = Date.now();
+  const { source } = tables.init();
+  console.log(`Lookup tables ${source} in ${Date.now() - started}ms`);
   app.listen(PORT, () => {
     console.log(`Server running on http://localhost:${PORT}`);
   });
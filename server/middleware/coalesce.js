@@ -0,0 +1,73 @@
+const { SingleFlight } = require('../services/singleflight');
+
+const flight = new SingleFlight();
+
+// Connection-level headers are the follower's own, not the leader's
+const HOP_HEADERS = new Set(['connection', 'keep-alive', 'transfer-encoding', 'date']);
+
+// Raw query values, not numbers: handlers may treat "5" and "5.0" differently
+function requestKey(req) {
+  const query = Object.keys(req.query)
+    .sort()
+    .map((k) => [k, req.query[k]]);
+  return `${req.baseUrl}${req.path}?${JSON.stringify(query)}#${req.get('if-none-match') || ''}`;
+}
+
+// Lets the rest of the chain answer the leader as usual while recording the
+// status, headers and body it sends.
+function capture(res, next) {
+  return new Promise((resolve) => {
+    const chunks = [];
+    const { write, end } = res;
+    const keep = (chunk, encoding) => {
+      if (chunk === undefined || chunk === null || typeof chunk === 'function') return;
+      chunks.push(typeof chunk === 'string' ? Buffer.from(chunk, typeof encoding === 'string' ? encoding : 'utf8') : Buffer.from(chunk));
+    };
+    res.write = function (chunk, encoding) {
+      keep(chunk, encoding);
+      return write.apply(this, arguments);
+    };
+    res.end = function (chunk, encoding) {
+      keep(chunk, encoding);
+      res.write = write;
+      res.end = end;
+      resolve({ status: res.statusCode, headers: res.getHeaders(), body: Buffer.concat(chunks) });
+      return end.apply(this, arguments);
+    };
+    // One turn of the event loop, so identical requests that arrived
+    // alongside this one join it even when the handler is synchronous
+    setImmediate(next);
+  });
+}
+
+function replay(res, { status, headers, body }) {
+  if (res.headersSent || res.destroyed) return;
+  for (const [name, value] of Object.entries(headers)) {
+    if (!HOP_HEADERS.has(name)) res.setHeader(name, value);
+  }
+  res.status(status).end(body);
+}
+
+// Concurrent identical GET requests to `paths` share one run of the handler
+// behind this middleware: the first runs it, the rest get its response
+// replayed. Validation and behaviour stay with the route handlers.
+function coalesce(paths) {
+  const shared = new Set(paths);
+  return function (req, res, next) {
+    if (req.method !== 'GET' || !shared.has(req.path)) {
+      next();
+      return;
+    }
+    let leader = false;
+    flight
+      .do(requestKey(req), () => {
+        leader = true;
+        return capture(res, next);
+      })
+      .then((response) => {
+        if (!leader) replay(res, response);
+      }, next);
+  };
+}
+
+module.exports = { coalesce, flight, requestKey };
@@ -0,0 +1,91 @@
+const crypto = require('crypto');
+const express = require('express');
+const profiler = require('../services/profiler');
+
+const router = express.Router();
+
+const MAX_PROFILE_SECONDS = 300;
+
+const digest = (s) => crypto.createHash('sha256').update(String(s)).digest();
+
+// Admin endpoints exist only when ADMIN_TOKEN is set; the token is accepted
+// as "Authorization: Bearer <token>" or "X-Admin-Token: <token>".
+function requireAdmin(req, res, next) {
+  const token = process.env.ADMIN_TOKEN;
+  if (!token) {
+    res.status(404).json({ error: 'not found' });
+    return;
+  }
+  const auth = req.get('authorization') || '';
+  const given = auth.startsWith('Bearer ') ? auth.slice(7) : req.get('x-admin-token') || '';
+  if (!crypto.timingSafeEqual(digest(given), digest(token))) {
+    res.status(401).json({ error: 'unauthorized' });
+    return;
+  }
+  next();
+}
+
+function fail(res, e) {
+  res.status(409).json({ error: e.message });
+}
+
+router.use(requireAdmin);
+
+// With ?seconds=N the profile is stopped and written after N seconds and the
+// response waits for it; without it the profile runs until /cpu/stop.
+router.post('/profile/cpu/start', async (req, res) => {
+  const seconds = req.query.seconds === undefined ? null : Number(req.query.seconds);
+  if (seconds !== null && !(seconds > 0 && seconds <= MAX_PROFILE_SECONDS)) {
+    res.status(400).json({ error: 'seconds' });
+    return;
+  }
+  try {
+    if (seconds === null) {
+      await profiler.startCpuProfile();
+      res.json({ status: 'started' });
+    } else {
+      res.json(await profiler.profileFor(seconds));
+    }
+  } catch (e) {
+    fail(res, e);
+  }
+});
+
+router.post('/profile/cpu/stop', async (_req, res) => {
+  try {
+    res.json(await profiler.stopCpuProfile());
+  } catch (e) {
+    fail(res, e);
+  }
+});
+
+router.post('/profile/heap', async (_req, res) => {
+  if (profiler.heapSnapshotting()) {
+    res.status(409).json({ error: 'heap snapshot already running' });
+    return;
+  }
+  try {
+    res.json(await profiler.writeHeapSnapshot());
+  } catch (e) {
+    res.status(500).json({ error: e.message });
+  }
+});
+
+router.get('/timing', (_req, res) => {
+  res.json({ enabled: profiler.timingEnabled(), stats: profiler.timingStats() });
+});
+
+// Body: { "enabled": true|false, "reset": true }
+router.post('/timing', (req, res) => {
+  const { enabled, reset } = req.body || {};
+  if (typeof enabled !== 'boolean') {
+    res.status(400).json({ error: 'enabled' });
+    return;
+  }
+  if (enabled) profiler.enableTiming();
+  else profiler.disableTiming();
+  if (reset) profiler.resetTiming();
+  res.json({ enabled: profiler.timingEnabled(), stats: profiler.timingStats() });
+});
+
+module.exports = router;
@@ -1,8 +1,14 @@
 const express = require('express');
 const { add, mul, safeDivide } = require('../utils/math');
+const { compile, LRU } = require('../utils/pipeline');
 
 const router = express.Router();
 
+const MAX_BATCH = 10000;
+const MAX_STEPS = 32;
+const BATCH_BODY_LIMIT = process.env.TRANSFORM_BODY_LIMIT || '5mb';
+const pipelines = new LRU(64);
+
 router.get('/add', (req, res) => {
   const a = Number(req.query.a);
   const b = Number(req.query.b);
@@ -25,4 +31,30 @@ router.get('/divide', (req, res) => {
   }
 });
 
+// Applies a chain of string transforms to every input in one request:
+// { "steps": ["normalizeWhitespace", "slugify"], "inputs": ["A b", ...] }
+router.post('/transform', express.json({ limit: BATCH_BODY_LIMIT }), (req, res) => {
+  const { steps, inputs } = req.body || {};
+  if (!Array.isArray(inputs) || inputs.length > MAX_BATCH || !inputs.every((s) => typeof s === 'string')) {
+    res.status(400).json({ error: 'inputs' });
+    return;
+  }
+  if (!Array.isArray(steps) || steps.length > MAX_STEPS) {
+    res.status(400).json({ error: 'steps' });
+    return;
+  }
+  const key = JSON.stringify(steps);
+  let run = pipelines.get(key);
+  if (!run) {
+    try {
+      run = compile(steps);
+    } catch (e) {
+      res.status(400).json({ error: 'steps' });
+      return;
+    }
+    pipelines.set(key, run);
+  }
+  res.json({ results: inputs.map((s) => run(s)) });
+});
+
 module.exports = router;
@@ -0,0 +1,149 @@
+const express = require('express');
+const { JobManager, QueueFullError, ResultTooLargeError } = require('../services/jobs');
+
+const router = express.Router();
+const manager = new JobManager();
+
+const MAX_PAGE = 10000;
+const MAX_PERMUTATION_ITEMS = 10;
+
+const finite = (n) => typeof n === 'number' && Number.isFinite(n);
+
+// Argument checks per operation; each returns true when args are usable
+const schemas = {
+  primes: (a) => finite(a.n),
+  factorial: (a) => finite(a.n),
+  fibonacci: (a) => finite(a.n),
+  permutations: (a) => Array.isArray(a.items) && a.items.length <= MAX_PERMUTATION_ITEMS,
+};
+
+// Resolves once res can take more data or the client has gone away; 'drain'
+// never fires after 'close'
+function writable(res) {
+  return new Promise((resolve) => {
+    if (res.destroyed) {
+      resolve();
+      return;
+    }
+    const done = () => {
+      res.off('drain', done);
+      res.off('close', done);
+      resolve();
+    };
+    res.on('drain', done);
+    res.on('close', done);
+  });
+}
+
+function findJob(req, res) {
+  const job = manager.get(req.params.id);
+  if (!job) res.status(404).json({ error: 'job not found' });
+  return job;
+}
+
+function resultReady(job, res) {
+  if (job.status !== 'succeeded') {
+    res.status(409).json({ error: 'result not available', status: job.status });
+    return false;
+  }
+  if (!job.result) {
+    res.status(410).json({ error: 'result expired' });
+    return false;
+  }
+  return true;
+}
+
+// Body: { "op": "primes", "args": { "n": 100000000 } }
+router.post('/', (req, res) => {
+  const { op, args = {} } = req.body || {};
+  if (!Object.prototype.hasOwnProperty.call(schemas, op)) {
+    res.status(400).json({ error: 'op' });
+    return;
+  }
+  if (typeof args !== 'object' || args === null || !schemas[op](args)) {
+    res.status(400).json({ error: 'args' });
+    return;
+  }
+  try {
+    const job = manager.submit(op, args);
+    res.status(202).location(`${req.baseUrl}/${job.id}`).json(job);
+  } catch (e) {
+    if (e instanceof ResultTooLargeError) {
+      res.status(400).json({ error: e.message });
+      return;
+    }
+    if (!(e instanceof QueueFullError)) throw e;
+    res.status(503).set('Retry-After', '1').json({ error: e.message });
+  }
+});
+
+router.get('/:id', (req, res) => {
+  const job = findJob(req, res);
+  if (job) res.json(job);
+});
+
+// Paged result: ?offset=0&limit=1000
+router.get('/:id/result', async (req, res) => {
+  const job = findJob(req, res);
+  if (!job || !resultReady(job, res)) return;
+  const offset = req.query.offset === undefined ? 0 : Number(req.query.offset);
+  const limit = req.query.limit === undefined ? 1000 : Number(req.query.limit);
+  if (!Number.isInteger(offset) || offset < 0) {
+    res.status(400).json({ error: 'offset' });
+    return;
+  }
+  if (!Number.isInteger(limit) || limit < 1 || limit > MAX_PAGE) {
+    res.status(400).json({ error: 'limit' });
+    return;
+  }
+  const page = await manager.store.page(job.id, offset, limit);
+  if (!page) {
+    res.status(410).json({ error: 'result expired' });
+    return;
+  }
+  res.json({ id: job.id, total: page.total, offset, limit, items: page.items });
+});
+
+// Whole result as newline-delimited JSON, one item per line
+router.get('/:id/stream', async (req, res) => {
+  const job = findJob(req, res);
+  if (!job || !resultReady(job, res)) return;
+  let closed = false;
+  res.on('close', () => {
+    closed = true;
+  });
+  res.type('application/x-ndjson');
+  try {
+    for await (const item of manager.store.items(job.id)) {
+      if (closed) return;
+      if (!res.write(JSON.stringify(item) + '\n')) await writable(res);
+      if (closed) return;
+    }
+    res.end();
+  } catch (e) {
+    // Headers are gone once streaming starts; cut the response short
+    res.destroy(e);
+  }
+});
+
+router.post('/:id/cancel', (req, res) => {
+  const job = manager.cancel(req.params.id);
+  if (!job) {
+    res.status(404).json({ error: 'job not found' });
+    return;
+  }
+  res.json(job);
+});
+
+// Cancels the job if it is still active and forgets it and its result
+router.delete('/:id', (req, res) => {
+  if (!manager.remove(req.params.id)) {
+    res.status(404).json({ error: 'job not found' });
+    return;
+  }
+  res.status(204).end();
+});
+
+router.manager = manager;
+
+module.exports = router;
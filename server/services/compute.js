@@ -0,0 +1,144 @@
+// Cooperative (event-loop friendly) versions of the expensive calculator
+// operations. Long loops yield periodically so other requests are served,
+// abort signals are honoured and progress can be reported.
+const calculator = require('./calculator');
+const tables = require('./tables');
+const { abortError } = require('./singleflight');
+
+const SEGMENT = 1 << 16;
+const SLICE_MS = 8;
+
+function tick() {
+  return new Promise((resolve) => setImmediate(resolve));
+}
+
+function createYielder(signal) {
+  let last = Date.now();
+  return async function maybeYield() {
+    if (Date.now() - last < SLICE_MS) return;
+    await tick();
+    last = Date.now();
+    if (signal && signal.aborted) throw abortError();
+  };
+}
+
+function tooLarge() {
+  return new RangeError('result too large');
+}
+
+function smallPrimes(limit) {
+  const sieve = new Uint8Array(limit + 1);
+  const out = [];
+  for (let i = 2; i <= limit; i++) {
+    if (sieve[i]) continue;
+    out.push(i);
+    for (let j = i * i; j <= limit; j += i) sieve[j] = 1;
+  }
+  return out;
+}
+
+// calculator.factorial/fibonacci, answered from the lookup tables when they
+// are loaded (the tables are built with the same arithmetic)
+function factorial(n) {
+  const t = tables.loaded();
+  if (t && Number.isInteger(n) && n >= 0) return n < t.factorials.length ? t.factorials[n] : Infinity;
+  return calculator.factorial(n);
+}
+
+function fibonacci(n) {
+  const t = tables.loaded();
+  if (t && Number.isInteger(n) && n >= 0) return n < t.fibonacci.length ? t.fibonacci[n] : Infinity;
+  return calculator.fibonacci(n);
+}
+
+// Same result as calculator.primesUpTo(n): a slice of the prime table when n
+// is within it, otherwise a segmented sieve of Eratosthenes.
+// options.maxItems caps the output; past it the run fails instead of growing.
+async function primesUpTo(n, options = {}) {
+  const { signal, onProgress, maxItems = Infinity } = options;
+  if (Number.isNaN(n) || n === Infinity) throw new RangeError('n must be finite');
+  const limit = Math.floor(n);
+  if (limit < 2) return [];
+  if (signal && signal.aborted) throw abortError();
+  const t = tables.loaded();
+  if (t && limit <= t.primeLimit) {
+    const count = tables.primeCount(t, limit);
+    if (count > maxItems) throw tooLarge();
+    return Array.from(t.primes.subarray(0, count));
+  }
+
+  const base = smallPrimes(Math.floor(Math.sqrt(limit)));
+  const out = [];
+  const seg = new Uint8Array(SEGMENT);
+  const maybeYield = createYielder(signal);
+
+  for (let low = 2; low <= limit; low += SEGMENT) {
+    const high = Math.min(low + SEGMENT - 1, limit);
+    seg.fill(0);
+    for (const p of base) {
+      const pp = p * p;
+      if (pp > high) break;
+      const start = pp >= low ? pp : Math.ceil(low / p) * p;
+      for (let j = start; j <= high; j += p) seg[j - low] = 1;
+    }
+    for (let i = low; i <= high; i++) {
+      if (!seg[i - low]) out.push(i);
+    }
+    if (out.length > maxItems) throw tooLarge();
+    if (onProgress) onProgress(high / limit);
+    await maybeYield();
+  }
+  return out;
+}
+
+// Same enumeration order as array.permutations: the backtracking swap
+// recursion unrolled into an explicit stack so it can yield between steps.
+async function permutations(items, options = {}) {
+  const { signal, onProgress, maxItems = Infinity } = options;
+  const a = items.slice();
+  const n = a.length;
+  const total = calculator.factorial(n);
+  if (total > maxItems) throw tooLarge();
+  const out = [];
+  const next = new Int32Array(n + 1);
+  const maybeYield = createYielder(signal);
+  const swap = (i, j) => {
+    const t = a[i];
+    a[i] = a[j];
+    a[j] = t;
+  };
+
+  let l = 0;
+  while (l >= 0) {
+    if (l === n) {
+      out.push(a.slice());
+      if (--l >= 0) swap(l, next[l] - 1);
+      if ((out.length & 4095) === 0) {
+        if (onProgress) onProgress(out.length / total);
+        await maybeYield();
+      }
+    } else if (next[l] < n) {
+      swap(l, next[l]++);
+      next[++l] = l;
+    } else if (--l >= 0) {
+      swap(l, next[l] - 1);
+    }
+  }
+  return out;
+}
+
+const operations = {
+  primes: ({ n }, ctx) => primesUpTo(n, ctx),
+  permutations: ({ items }, ctx) => permutations(items, ctx),
+  factorial: ({ n }) => factorial(n),
+  fibonacci: ({ n }) => fibonacci(n),
+};
+
+async function run(op, args, ctx = {}) {
+  const fn = operations[op];
+  if (!fn) throw new Error('unknown operation: ' + op);
+  if (ctx.signal && ctx.signal.aborted) throw abortError();
+  return fn(args, ctx);
+}
+
+module.exports = { factorial, fibonacci, primesUpTo, permutations, operations, run };
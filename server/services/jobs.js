@@ -0,0 +1,165 @@
+// Background jobs for computations that outlive an HTTP request. Jobs wait in
+// a bounded queue, run on a fixed number of executor slots and hand their
+// results to a result store; queued or running jobs can be cancelled.
+const crypto = require('crypto');
+const compute = require('./compute');
+const { createStore, estimateBytes } = require('./results');
+
+const ACTIVE = new Set(['queued', 'running']);
+
+class QueueFullError extends Error {
+  constructor() {
+    super('job queue is full');
+    this.name = 'QueueFullError';
+  }
+}
+
+class ResultTooLargeError extends Error {
+  constructor() {
+    super('result too large');
+    this.name = 'ResultTooLargeError';
+  }
+}
+
+// Item count and bytes per item of an operation's result, in the same terms
+// as results.estimateBytes; null for operations with a scalar result. Primes
+// use pi(n) ~ n / ln n, which undershoots, so compute also stops a run once
+// its output passes the cap.
+function resultShape(op, args) {
+  if (op === 'primes') {
+    const n = Math.floor(args.n);
+    return { count: n < 2 ? 0 : Math.ceil(n / Math.log(n)), itemBytes: 16 };
+  }
+  if (op === 'permutations') {
+    let count = 1;
+    for (let i = 2; i <= args.items.length; i++) count *= i;
+    return { count, itemBytes: 8 + estimateBytes(args.items) };
+  }
+  return null;
+}
+
+class JobManager {
+  constructor(options = {}) {
+    this.concurrency = options.concurrency || Number(process.env.JOBS_CONCURRENCY) || 2;
+    this.maxQueue = options.maxQueue || Number(process.env.JOBS_MAX_QUEUE) || 1000;
+    this.store = options.store || createStore();
+    this.run = options.run || compute.run;
+    this.jobs = new Map();
+    this.queue = [];
+    this.running = 0;
+  }
+
+  submit(op, args = {}) {
+    if (!compute.operations[op]) throw new Error('unknown operation: ' + op);
+    const shape = resultShape(op, args);
+    const maxItems = shape ? Math.floor((this.store.maxBytes - 16) / shape.itemBytes) : undefined;
+    if (shape && shape.count > maxItems) throw new ResultTooLargeError();
+    if (this.queue.length >= this.maxQueue) throw new QueueFullError();
+    this.prune();
+    const job = {
+      id: crypto.randomUUID(),
+      op,
+      args,
+      status: 'queued',
+      progress: 0,
+      maxItems,
+      error: null,
+      createdAt: Date.now(),
+      startedAt: null,
+      finishedAt: null,
+      controller: new AbortController(),
+    };
+    this.jobs.set(job.id, job);
+    this.queue.push(job);
+    this.pump();
+    return this.view(job);
+  }
+
+  get(id) {
+    const job = this.jobs.get(id);
+    return job ? this.view(job) : null;
+  }
+
+  // Returns the job after cancelling, or null if unknown. Finished jobs are
+  // left untouched.
+  cancel(id) {
+    const job = this.jobs.get(id);
+    if (!job) return null;
+    if (job.status === 'queued') {
+      this.queue.splice(this.queue.indexOf(job), 1);
+      this.finish(job, 'cancelled');
+    } else if (job.status === 'running') {
+      job.controller.abort();
+    }
+    return this.view(job);
+  }
+
+  remove(id) {
+    const job = this.jobs.get(id);
+    if (!job) return false;
+    if (ACTIVE.has(job.status)) this.cancel(id);
+    this.jobs.delete(id);
+    this.store.delete(id);
+    return true;
+  }
+
+  pump() {
+    while (this.running < this.concurrency && this.queue.length) {
+      this.execute(this.queue.shift());
+    }
+  }
+
+  async execute(job) {
+    this.running += 1;
+    job.status = 'running';
+    job.startedAt = Date.now();
+    const ctx = {
+      signal: job.controller.signal,
+      maxItems: job.maxItems,
+      onProgress: (p) => {
+        job.progress = Math.min(1, p);
+      },
+    };
+    try {
+      const result = await this.run(job.op, job.args, ctx);
+      if (job.controller.signal.aborted) throw Object.assign(new Error('aborted'), { name: 'AbortError' });
+      await this.store.put(job.id, result);
+      // Removed or cancelled while the result was being written: nothing will
+      // ever read it, so it must not stay in the store
+      if (!this.jobs.has(job.id) || job.controller.signal.aborted) {
+        this.store.delete(job.id);
+        throw Object.assign(new Error('aborted'), { name: 'AbortError' });
+      }
+      job.progress = 1;
+      this.finish(job, 'succeeded');
+    } catch (e) {
+      if (e.name === 'AbortError') this.finish(job, 'cancelled');
+      else this.finish(job, 'failed', e.message);
+    } finally {
+      this.running -= 1;
+      this.pump();
+    }
+  }
+
+  finish(job, status, error = null) {
+    job.status = status;
+    job.error = error;
+    job.finishedAt = Date.now();
+  }
+
+  // Forgets finished jobs whose results have been evicted for a full TTL
+  prune() {
+    const cutoff = Date.now() - this.store.ttlMs;
+    for (const [id, job] of this.jobs) {
+      if (!ACTIVE.has(job.status) && job.finishedAt < cutoff && !this.store.has(id)) this.jobs.delete(id);
+    }
+  }
+
+  view(job) {
+    const { controller, maxItems, ...rest } = job;
+    const meta = job.status === 'succeeded' ? this.store.meta(job.id) : null;
+    return { ...rest, result: meta ? { total: meta.total, expiresAt: meta.expiresAt } : null };
+  }
+}
+
+module.exports = { JobManager, QueueFullError, ResultTooLargeError, resultShape };
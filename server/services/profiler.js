@@ -0,0 +1,205 @@
+// On-demand diagnostics for a running process: sampling CPU profiles and heap
+// snapshots through the built-in inspector, plus optional timing wrappers
+// around the calculator exports and the job operations in compute.js.
+const fs = require('fs');
+const { once } = require('events');
+const os = require('os');
+const path = require('path');
+const inspector = require('inspector');
+const calculator = require('./calculator');
+const compute = require('./compute');
+
+let session = null;
+let cpuStartedAt = null;
+let heapSnapshotRunning = false;
+
+function profileDir() {
+  const dir = process.env.PROFILE_DIR || path.join(os.tmpdir(), 'mern-profiles');
+  fs.mkdirSync(dir, { recursive: true });
+  return dir;
+}
+
+function artifactPath(kind, ext) {
+  const stamp = new Date().toISOString().replace(/[:.]/g, '-');
+  return path.join(profileDir(), `${kind}-${stamp}-${process.pid}${ext}`);
+}
+
+function post(method, params) {
+  if (!session) {
+    session = new inspector.Session();
+    session.connect();
+  }
+  return new Promise((resolve, reject) => {
+    session.post(method, params, (err, result) => (err ? reject(err) : resolve(result)));
+  });
+}
+
+function cpuProfiling() {
+  return cpuStartedAt !== null;
+}
+
+async function startCpuProfile(options = {}) {
+  if (cpuProfiling()) throw new Error('cpu profile already running');
+  cpuStartedAt = Date.now();
+  try {
+    await post('Profiler.enable');
+    if (options.samplingIntervalUs) await post('Profiler.setSamplingInterval', { interval: options.samplingIntervalUs });
+    await post('Profiler.start');
+  } catch (e) {
+    cpuStartedAt = null;
+    throw e;
+  }
+}
+
+// Stops the running profile and writes it as a .cpuprofile file
+async function stopCpuProfile() {
+  if (!cpuProfiling()) throw new Error('no cpu profile running');
+  const durationMs = Date.now() - cpuStartedAt;
+  try {
+    const { profile } = await post('Profiler.stop');
+    const file = artifactPath('cpu', '.cpuprofile');
+    await fs.promises.writeFile(file, JSON.stringify(profile));
+    return { file, durationMs };
+  } finally {
+    cpuStartedAt = null;
+    await post('Profiler.disable').catch(() => {});
+  }
+}
+
+async function profileFor(seconds, options) {
+  await startCpuProfile(options);
+  await new Promise((resolve) => setTimeout(resolve, seconds * 1000));
+  return stopCpuProfile();
+}
+
+function heapSnapshotting() {
+  return heapSnapshotRunning;
+}
+
+// Snapshot chunks arrive as session events that every listener sees, so only
+// one snapshot may be in flight at a time.
+async function writeHeapSnapshot() {
+  if (heapSnapshotting()) throw new Error('heap snapshot already running');
+  heapSnapshotRunning = true;
+  try {
+    const file = artifactPath('heap', '.heapsnapshot');
+    const out = fs.createWriteStream(file);
+    let error = null;
+    out.on('error', (e) => {
+      error = error || e;
+    });
+    // Fails here, not as an uncaught 'error', when PROFILE_DIR is unwritable
+    await once(out, 'open');
+    const onChunk = (m) => out.write(m.params.chunk);
+    await post('HeapProfiler.enable');
+    session.on('HeapProfiler.addHeapSnapshotChunk', onChunk);
+    try {
+      await post('HeapProfiler.takeHeapSnapshot', { reportProgress: false });
+    } finally {
+      session.removeListener('HeapProfiler.addHeapSnapshotChunk', onChunk);
+      await new Promise((resolve) => out.end(resolve));
+    }
+    if (error) throw error;
+    return { file, bytes: (await fs.promises.stat(file)).size };
+  } finally {
+    heapSnapshotRunning = false;
+  }
+}
+
+// Timing wrappers go around the calculator exports and compute.operations
+// once, from outside the modules, and record only while timing is enabled.
+// Routers destructure the calculator exports when they are loaded, so
+// server/index.js calls instrument() before requiring them when ADMIN_TOKEN
+// is set; without a token nothing is wrapped and calls pay no overhead.
+// Operations are recorded as "compute.<op>" and, being asynchronous, are
+// timed until their promise settles.
+let instrumented = false;
+let timing = false;
+const stats = new Map();
+
+function record(name, started) {
+  const ns = Number(process.hrtime.bigint() - started);
+  const s = stats.get(name) || { calls: 0, totalNs: 0, maxNs: 0 };
+  s.calls += 1;
+  s.totalNs += ns;
+  if (ns > s.maxNs) s.maxNs = ns;
+  stats.set(name, s);
+}
+
+function wrap(target, prefix) {
+  for (const [key, fn] of Object.entries(target)) {
+    if (typeof fn !== 'function') continue;
+    const name = prefix + key;
+    target[key] = function (...args) {
+      if (!timing) return fn.apply(this, args);
+      const started = process.hrtime.bigint();
+      let result;
+      try {
+        result = fn.apply(this, args);
+      } catch (e) {
+        record(name, started);
+        throw e;
+      }
+      if (result && typeof result.then === 'function') {
+        const done = () => record(name, started);
+        result.then(done, done);
+      } else {
+        record(name, started);
+      }
+      return result;
+    };
+  }
+}
+
+function instrument() {
+  if (instrumented) return;
+  instrumented = true;
+  wrap(calculator, '');
+  wrap(compute.operations, 'compute.');
+}
+
+function timingEnabled() {
+  return timing;
+}
+
+function enableTiming() {
+  instrument();
+  timing = true;
+}
+
+function disableTiming() {
+  timing = false;
+}
+
+function timingStats() {
+  const out = {};
+  for (const [name, s] of stats) {
+    out[name] = {
+      calls: s.calls,
+      totalMs: s.totalNs / 1e6,
+      meanUs: s.totalNs / s.calls / 1e3,
+      maxUs: s.maxNs / 1e3,
+    };
+  }
+  return out;
+}
+
+function resetTiming() {
+  stats.clear();
+}
+
+module.exports = {
+  profileDir,
+  cpuProfiling,
+  startCpuProfile,
+  stopCpuProfile,
+  profileFor,
+  heapSnapshotting,
+  writeHeapSnapshot,
+  instrument,
+  timingEnabled,
+  enableTiming,
+  disableTiming,
+  timingStats,
+  resetTiming,
+};
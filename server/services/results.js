@@ -0,0 +1,189 @@
+// Size-capped, TTL-evicting stores for job results. Both backends share one
+// interface: put/has/delete, page(id, offset, limit) and items(id) (an async
+// iterator used for streaming). Array results are paged per element; any
+// other value is a single item.
+const fs = require('fs');
+const os = require('os');
+const path = require('path');
+const readline = require('readline');
+
+// Rough in-memory footprint; large arrays are sampled rather than walked
+function estimateBytes(value) {
+  if (value === null || value === undefined) return 8;
+  if (typeof value === 'number' || typeof value === 'boolean') return 8;
+  if (typeof value === 'string') return 16 + value.length * 2;
+  if (Array.isArray(value)) {
+    const n = value.length;
+    if (!n) return 16;
+    const sample = Math.min(n, 64);
+    let bytes = 0;
+    for (let i = 0; i < sample; i++) bytes += estimateBytes(value[Math.floor((i * n) / sample)]);
+    return 16 + 8 * n + Math.ceil((bytes / sample) * n);
+  }
+  return 16 + JSON.stringify(value).length * 2;
+}
+
+class BaseStore {
+  constructor(options = {}) {
+    this.maxBytes = options.maxBytes || 256 * 1024 * 1024;
+    this.ttlMs = options.ttlMs || 15 * 60 * 1000;
+    this.entries = new Map(); // insertion order doubles as eviction order
+    this.bytes = 0;
+  }
+
+  has(id) {
+    this.sweep();
+    return this.entries.has(id);
+  }
+
+  meta(id) {
+    this.sweep();
+    const e = this.entries.get(id);
+    return e ? { bytes: e.bytes, isArray: e.isArray, total: e.total, expiresAt: e.expiresAt } : null;
+  }
+
+  // Makes room for `bytes`, oldest first; false if it can never fit
+  reserve(bytes) {
+    if (bytes > this.maxBytes) return false;
+    for (const id of this.entries.keys()) {
+      if (this.bytes + bytes <= this.maxBytes) break;
+      this.delete(id);
+    }
+    return true;
+  }
+
+  track(id, entry) {
+    this.entries.set(id, { ...entry, expiresAt: Date.now() + this.ttlMs });
+    this.bytes += entry.bytes;
+  }
+
+  delete(id) {
+    const e = this.entries.get(id);
+    if (!e) return false;
+    this.entries.delete(id);
+    this.bytes -= e.bytes;
+    this.release(e);
+    return true;
+  }
+
+  release() {}
+
+  // Entries share one TTL, so expiry follows insertion order
+  sweep() {
+    const now = Date.now();
+    for (const [id, e] of this.entries) {
+      if (e.expiresAt > now) break;
+      this.delete(id);
+    }
+  }
+}
+
+class MemoryStore extends BaseStore {
+  async put(id, value) {
+    const bytes = estimateBytes(value);
+    this.sweep();
+    if (!this.reserve(bytes)) throw new Error('result too large');
+    const isArray = Array.isArray(value);
+    this.track(id, { bytes, isArray, total: isArray ? value.length : 1, value });
+  }
+
+  async page(id, offset, limit) {
+    const e = this.has(id) && this.entries.get(id);
+    if (!e) return null;
+    const items = e.isArray ? e.value.slice(offset, offset + limit) : offset === 0 ? [e.value] : [];
+    return { total: e.total, items };
+  }
+
+  async *items(id) {
+    const e = this.has(id) && this.entries.get(id);
+    if (!e) return;
+    if (!e.isArray) {
+      yield e.value;
+      return;
+    }
+    for (const x of e.value) yield x;
+  }
+}
+
+// One newline-delimited JSON file per result, so pages and streams read
+// lines without parsing the whole result.
+class DiskStore extends BaseStore {
+  constructor(options = {}) {
+    super(options);
+    this.dir = options.dir || path.join(os.tmpdir(), 'mern-job-results');
+    fs.mkdirSync(this.dir, { recursive: true });
+  }
+
+  file(id) {
+    return path.join(this.dir, `${id}.ndjson`);
+  }
+
+  async put(id, value) {
+    const isArray = Array.isArray(value);
+    const list = isArray ? value : [value];
+    const file = this.file(id);
+    const out = fs.createWriteStream(file);
+    let bytes = 0;
+    for (const x of list) {
+      const line = JSON.stringify(x === undefined ? null : x) + '\n';
+      bytes += Buffer.byteLength(line);
+      if (!out.write(line)) await new Promise((resolve) => out.once('drain', resolve));
+    }
+    await new Promise((resolve, reject) => out.end((err) => (err ? reject(err) : resolve())));
+    this.sweep();
+    if (!this.reserve(bytes)) {
+      fs.rmSync(file, { force: true });
+      throw new Error('result too large');
+    }
+    this.track(id, { bytes, isArray, total: list.length, file });
+  }
+
+  release(e) {
+    fs.rm(e.file, { force: true }, () => {});
+  }
+
+  // Closing readline leaves its input open, so the file stream is destroyed
+  // explicitly however the iteration ends
+  async *lines(file) {
+    const input = fs.createReadStream(file);
+    const rl = readline.createInterface({ input, crlfDelay: Infinity });
+    try {
+      yield* rl;
+    } finally {
+      rl.close();
+      input.destroy();
+    }
+  }
+
+  async page(id, offset, limit) {
+    const e = this.has(id) && this.entries.get(id);
+    if (!e) return null;
+    const items = [];
+    let i = 0;
+    for await (const line of this.lines(e.file)) {
+      if (i >= offset + limit) break;
+      if (i++ >= offset) items.push(JSON.parse(line));
+    }
+    return { total: e.total, items };
+  }
+
+  async *items(id) {
+    const e = this.has(id) && this.entries.get(id);
+    if (!e) return;
+    for await (const line of this.lines(e.file)) yield JSON.parse(line);
+  }
+}
+
+function createStore(options = {}) {
+  const kind = options.kind || process.env.JOBS_STORE || 'memory';
+  const config = {
+    maxBytes: options.maxBytes || Number(process.env.JOBS_STORE_MAX_BYTES) || undefined,
+    ttlMs: options.ttlMs || Number(process.env.JOBS_RESULT_TTL_MS) || undefined,
+    dir: options.dir || process.env.JOBS_STORE_DIR,
+  };
+  if (kind === 'disk') return new DiskStore(config);
+  if (kind === 'memory') return new MemoryStore(config);
+  throw new Error('unknown result store: ' + kind);
+}
+
+module.exports = { MemoryStore, DiskStore, createStore, estimateBytes };
@@ -0,0 +1,82 @@
+// Coalesces concurrent identical computations into one shared in-flight call.
+// Every caller waiting on a key holds a reference; the shared computation is
+// aborted only once all of them have gone away.
+
+function abortError() {
+  const err = new Error('aborted');
+  err.name = 'AbortError';
+  return err;
+}
+
+class SingleFlight {
+  constructor() {
+    this.calls = new Map();
+  }
+
+  get size() {
+    return this.calls.size;
+  }
+
+  has(key) {
+    return this.calls.has(key);
+  }
+
+  // Runs fn(signal) once per key among concurrent callers. fn receives the
+  // shared AbortSignal and must return a value or a promise. Each caller may
+  // pass its own signal; aborting it detaches only that caller.
+  do(key, fn, options = {}) {
+    const { signal } = options;
+    if (signal && signal.aborted) return Promise.reject(abortError());
+
+    const call = this.calls.get(key) || this.start(key, fn);
+    return this.wait(key, call, signal);
+  }
+
+  start(key, fn) {
+    const controller = new AbortController();
+    const call = { controller, refs: 0, promise: null };
+    this.calls.set(key, call);
+    call.promise = Promise.resolve()
+      .then(() => fn(controller.signal))
+      .finally(() => {
+        if (this.calls.get(key) === call) this.calls.delete(key);
+      });
+    // Waiters observe the outcome individually; keep the shared promise from
+    // surfacing as an unhandled rejection when everyone has detached.
+    call.promise.catch(() => {});
+    return call;
+  }
+
+  wait(key, call, signal) {
+    call.refs += 1;
+    return new Promise((resolve, reject) => {
+      let done = false;
+      const release = () => {
+        if (done) return false;
+        done = true;
+        if (signal) signal.removeEventListener('abort', onAbort);
+        return true;
+      };
+      const onAbort = () => {
+        if (!release()) return;
+        call.refs -= 1;
+        if (call.refs === 0) {
+          if (this.calls.get(key) === call) this.calls.delete(key);
+          call.controller.abort();
+        }
+        reject(abortError());
+      };
+      if (signal) signal.addEventListener('abort', onAbort, { once: true });
+      call.promise.then(
+        (value) => {
+          if (release()) resolve(value);
+        },
+        (err) => {
+          if (release()) reject(err);
+        }
+      );
+    });
+  }
+}
+
+module.exports = { SingleFlight, abortError };
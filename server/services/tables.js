@@ -0,0 +1,244 @@
+// Precomputed lookup tables (factorials, fibonacci numbers, primes) persisted
+// in a versioned, checksummed binary file so restarts come up warm.
+//
+// Layout (little endian):
+//   0  magic "MTBL"
+//   4  u32 format version
+//   8  u32 prime limit
+//   12 u32 section count
+//   16 u32 crc32 of every byte from offset 20 to the end
+//   20 section directory, 16 bytes per entry: u32 id, u32 dtype, u32 offset, u32 length
+//   .. section payloads, each 8-byte aligned
+//
+// Sections are exposed as typed-array views over the loaded buffer, so the
+// tables are never copied after the single read.
+const fs = require('fs');
+const path = require('path');
+const zlib = require('zlib');
+
+const MAGIC = 0x4c42544d; // "MTBL"
+const FORMAT_VERSION = 2;
+const HEADER_SIZE = 20;
+const ENTRY_SIZE = 16;
+
+const DEFAULT_PRIME_LIMIT = 10000000;
+const DEFAULT_PATH = path.join(__dirname, '..', '..', '.cache', 'tables.bin');
+
+const SECTIONS = { factorials: 1, fibonacci: 2, primes: 3 };
+const DTYPES = { 1: Float64Array, 2: Uint32Array, 3: Uint8Array };
+
+let crcTable = null;
+function crc32(buf) {
+  if (typeof zlib.crc32 === 'function') return zlib.crc32(buf) >>> 0;
+  if (!crcTable) {
+    crcTable = new Uint32Array(256);
+    for (let i = 0; i < 256; i++) {
+      let c = i;
+      for (let k = 0; k < 8; k++) c = c & 1 ? 0xedb88320 ^ (c >>> 1) : c >>> 1;
+      crcTable[i] = c >>> 0;
+    }
+  }
+  let crc = 0xffffffff;
+  for (let i = 0; i < buf.length; i++) crc = crcTable[(crc ^ buf[i]) & 0xff] ^ (crc >>> 8);
+  return (crc ^ 0xffffffff) >>> 0;
+}
+
+function dtypeOf(arr) {
+  for (const [id, T] of Object.entries(DTYPES)) {
+    if (arr instanceof T) return Number(id);
+  }
+  throw new TypeError('unsupported table type');
+}
+
+function buildFactorials() {
+  // Same accumulation order as calculator.factorial, so lookups are exact
+  const out = [1, 1];
+  let r = 1;
+  for (let i = 2; ; i++) {
+    r *= i;
+    if (r === Infinity) break;
+    out.push(r);
+  }
+  return Float64Array.from(out);
+}
+
+function buildFibonacci() {
+  const out = [];
+  let a = 0,
+    b = 1;
+  while (a !== Infinity) {
+    out.push(a);
+    [a, b] = [b, a + b];
+  }
+  return Float64Array.from(out);
+}
+
+// Bit-packed sieve: composite[i >> 3] bit (i & 7) is set when i is not prime
+function buildPrimes(limit) {
+  const composite = new Uint8Array((limit >> 3) + 1);
+  composite[0] |= 0b11;
+  let count = 0;
+  for (let i = 2; i <= limit; i++) {
+    if (composite[i >> 3] & (1 << (i & 7))) continue;
+    count++;
+    for (let j = i * i; j <= limit; j += i) composite[j >> 3] |= 1 << (j & 7);
+  }
+  const primes = new Uint32Array(count);
+  for (let i = 2, k = 0; i <= limit; i++) {
+    if (!(composite[i >> 3] & (1 << (i & 7)))) primes[k++] = i;
+  }
+  return primes;
+}
+
+function build(primeLimit = DEFAULT_PRIME_LIMIT) {
+  const primes = buildPrimes(primeLimit);
+  return {
+    primeLimit,
+    factorials: buildFactorials(),
+    fibonacci: buildFibonacci(),
+    primes,
+  };
+}
+
+function serialize(tables) {
+  const names = Object.keys(SECTIONS);
+  let offset = HEADER_SIZE + names.length * ENTRY_SIZE;
+  const layout = names.map((name) => {
+    offset = Math.ceil(offset / 8) * 8;
+    const arr = tables[name];
+    const entry = { name, arr, offset };
+    offset += arr.byteLength;
+    return entry;
+  });
+  const buf = Buffer.alloc(offset);
+  buf.writeUInt32LE(MAGIC, 0);
+  buf.writeUInt32LE(FORMAT_VERSION, 4);
+  buf.writeUInt32LE(tables.primeLimit, 8);
+  buf.writeUInt32LE(names.length, 12);
+  layout.forEach(({ name, arr, offset: off }, i) => {
+    const at = HEADER_SIZE + i * ENTRY_SIZE;
+    buf.writeUInt32LE(SECTIONS[name], at);
+    buf.writeUInt32LE(dtypeOf(arr), at + 4);
+    buf.writeUInt32LE(off, at + 8);
+    buf.writeUInt32LE(arr.length, at + 12);
+    Buffer.from(arr.buffer, arr.byteOffset, arr.byteLength).copy(buf, off);
+  });
+  buf.writeUInt32LE(crc32(buf.subarray(HEADER_SIZE)), 16);
+  return buf;
+}
+
+// Returns the tables as views over buf, or null if buf is not a valid file
+// for this format version.
+function parse(buf) {
+  if (buf.length < HEADER_SIZE) return null;
+  if (buf.readUInt32LE(0) !== MAGIC || buf.readUInt32LE(4) !== FORMAT_VERSION) return null;
+  if (crc32(buf.subarray(HEADER_SIZE)) !== buf.readUInt32LE(16)) return null;
+  const count = buf.readUInt32LE(12);
+  if (HEADER_SIZE + count * ENTRY_SIZE > buf.length) return null;
+
+  const tables = { primeLimit: buf.readUInt32LE(8) };
+  const byId = Object.fromEntries(Object.entries(SECTIONS).map(([k, v]) => [v, k]));
+  for (let i = 0; i < count; i++) {
+    const at = HEADER_SIZE + i * ENTRY_SIZE;
+    const name = byId[buf.readUInt32LE(at)];
+    const T = DTYPES[buf.readUInt32LE(at + 4)];
+    const off = buf.readUInt32LE(at + 8);
+    const len = buf.readUInt32LE(at + 12);
+    if (!name || !T || off + len * T.BYTES_PER_ELEMENT > buf.length) return null;
+    const start = buf.byteOffset + off;
+    tables[name] =
+      start % T.BYTES_PER_ELEMENT === 0
+        ? new T(buf.buffer, start, len)
+        : new T(buf.buffer.slice(start, start + len * T.BYTES_PER_ELEMENT));
+  }
+  for (const name of Object.keys(SECTIONS)) {
+    if (!tables[name]) return null;
+  }
+  return tables;
+}
+
+function writeAtomic(file, buf) {
+  fs.mkdirSync(path.dirname(file), { recursive: true });
+  const tmp = `${file}.${process.pid}.tmp`;
+  fs.writeFileSync(tmp, buf);
+  fs.renameSync(tmp, file);
+}
+
+function tablesPath() {
+  return process.env.TABLES_PATH || DEFAULT_PATH;
+}
+
+function primeLimit() {
+  const v = Number(process.env.TABLES_PRIME_LIMIT);
+  return Number.isInteger(v) && v >= 2 && v <= 0x7fffffff ? v : DEFAULT_PRIME_LIMIT;
+}
+
+// Loads the tables from disk, rebuilding (and persisting) them when the file
+// is missing, corrupt, from another format version or for another prime limit.
+function load(options = {}) {
+  const file = options.file || tablesPath();
+  const limit = options.primeLimit || primeLimit();
+  try {
+    const tables = parse(fs.readFileSync(file));
+    if (tables && tables.primeLimit === limit) return Object.assign(tables, { source: 'disk' });
+  } catch (_) {
+    // fall through to a rebuild
+  }
+  const tables = build(limit);
+  try {
+    writeAtomic(file, serialize(tables));
+  } catch (_) {
+    // read-only deployments still get the in-memory tables
+  }
+  return Object.assign(tables, { source: 'built' });
+}
+
+// Process-wide tables. Nothing loads them implicitly: the server calls init()
+// before listening, and until then loaded() is null and compute.js works the
+// values out directly.
+let current = null;
+
+function init(options) {
+  current = load(options);
+  return current;
+}
+
+function loaded() {
+  return current;
+}
+
+function reset() {
+  current = null;
+}
+
+// Number of table primes <= n
+function primeCount(tables, n) {
+  const { primes } = tables;
+  let lo = 0,
+    hi = primes.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >>> 1;
+    if (primes[mid] <= n) lo = mid + 1;
+    else hi = mid;
+  }
+  return lo;
+}
+
+if (require.main === module) {
+  const started = Date.now();
+  const tables = load();
+  console.log(`tables ${tables.source} from ${tablesPath()} in ${Date.now() - started}ms`);
+}
+
+module.exports = {
+  FORMAT_VERSION,
+  build,
+  serialize,
+  parse,
+  load,
+  init,
+  loaded,
+  reset,
+  primeCount,
+  tablesPath,
+};
@@ -1,9 +1,31 @@
+const collection = require('./collection');
+
+// Non-decreasing finite numbers: both sides of intersect/difference then
+// allow a merge instead of building a Set. Unsorted input exits early.
+function sortedNumbers(arr) {
+  for (let i = 0; i < arr.length; i++) {
+    const x = arr[i];
+    if (!Number.isFinite(x) || (i > 0 && arr[i - 1] > x)) return false;
+  }
+  return true;
+}
+
+// Quickselect agrees with the sort in median() except on the sign of a zero
+// result, so only NaN-free numbers without -0 take it
+function selectable(arr) {
+  for (let i = 0; i < arr.length; i++) {
+    const x = arr[i];
+    if (typeof x !== 'number' || x !== x || (x === 0 && 1 / x < 0)) return false;
+  }
+  return true;
+}
+
 function uniq(arr) {
   return Array.from(new Set(arr));
 }
 
 function flatten(arr) {
-  return arr.reduce((a, b) => a.concat(b), []);
+  return collection.flatten(arr);
 }
 
 function chunk(arr, size) {
@@ -13,11 +35,12 @@ function chunk(arr, size) {
 }
 
 function groupBy(arr, fn) {
-  return arr.reduce((m, x) => {
+  const m = {};
+  for (const x of arr) {
     const k = fn(x);
     (m[k] || (m[k] = [])).push(x);
-    return m;
-  }, {});
+  }
+  return m;
 }
 
 function partition(arr, fn) {
@@ -53,11 +76,13 @@ function range(n, start = 0) {
 }
 
 function intersect(a, b) {
+  if (sortedNumbers(a) && sortedNumbers(b)) return collection.intersectSorted(a, b);
   const s = new Set(b);
   return a.filter((x) => s.has(x));
 }
 
 function difference(a, b) {
+  if (sortedNumbers(a) && sortedNumbers(b)) return collection.differenceSorted(a, b);
   const s = new Set(b);
   return a.filter((x) => !s.has(x));
 }
@@ -81,6 +106,7 @@ function average(arr) {
 
 function median(arr) {
   if (!arr.length) return 0;
+  if (selectable(arr)) return collection.medianNumeric(arr);
   const a = arr.slice().sort((x, y) => x - y);
   const m = Math.floor(a.length / 2);
   return a.length % 2 ? a[m] : (a[m - 1] + a[m]) / 2;
@@ -0,0 +1,252 @@
+// Performance-oriented counterparts to the helpers in array.js: iterative
+// flattening, merge-based set operations on sorted input, Map-based grouping,
+// non-copying views and typed-array paths for numeric data.
+
+const numeric = (a, b) => a - b;
+
+function isNumericArray(arr) {
+  if (ArrayBuffer.isView(arr)) return !(arr instanceof DataView);
+  for (let i = 0; i < arr.length; i++) {
+    if (typeof arr[i] !== 'number') return false;
+  }
+  return true;
+}
+
+// Flattens up to `depth` levels without recursion. A first pass sizes the
+// output so it is written exactly once.
+function flattenDepth(arr, depth = 1) {
+  let total = 0;
+  const stack = [[arr, 0, 0]];
+  while (stack.length) {
+    const top = stack[stack.length - 1];
+    const [src, i, d] = top;
+    if (i === src.length) {
+      stack.pop();
+      continue;
+    }
+    top[1] = i + 1;
+    const x = src[i];
+    if (d < depth && Array.isArray(x)) stack.push([x, 0, d + 1]);
+    else total++;
+  }
+
+  const out = new Array(total);
+  let k = 0;
+  stack.push([arr, 0, 0]);
+  while (stack.length) {
+    const top = stack[stack.length - 1];
+    const [src, i, d] = top;
+    if (i === src.length) {
+      stack.pop();
+      continue;
+    }
+    top[1] = i + 1;
+    const x = src[i];
+    if (d < depth && Array.isArray(x)) stack.push([x, 0, d + 1]);
+    else out[k++] = x;
+  }
+  return out;
+}
+
+function flatten(arr) {
+  // One level, like the original reduce/concat version
+  let total = 0;
+  for (let i = 0; i < arr.length; i++) total += Array.isArray(arr[i]) ? arr[i].length : 1;
+  const out = new Array(total);
+  let k = 0;
+  for (let i = 0; i < arr.length; i++) {
+    const x = arr[i];
+    if (Array.isArray(x)) {
+      for (let j = 0; j < x.length; j++) out[k++] = x[j];
+    } else {
+      out[k++] = x;
+    }
+  }
+  return out;
+}
+
+// Set operations on inputs already sorted by `cmp`. Elements of `a` keep
+// their order and multiplicity, matching array.intersect/difference.
+function intersectSorted(a, b, cmp = numeric) {
+  const out = [];
+  let j = 0;
+  for (let i = 0; i < a.length; i++) {
+    while (j < b.length && cmp(b[j], a[i]) < 0) j++;
+    if (j === b.length) break;
+    if (cmp(b[j], a[i]) === 0) out.push(a[i]);
+  }
+  return out;
+}
+
+function differenceSorted(a, b, cmp = numeric) {
+  const out = [];
+  let j = 0;
+  for (let i = 0; i < a.length; i++) {
+    while (j < b.length && cmp(b[j], a[i]) < 0) j++;
+    if (j === b.length || cmp(b[j], a[i]) !== 0) out.push(a[i]);
+  }
+  return out;
+}
+
+function unionSorted(a, b, cmp = numeric) {
+  const out = [];
+  let i = 0,
+    j = 0;
+  while (i < a.length || j < b.length) {
+    let x;
+    if (j === b.length || (i < a.length && cmp(a[i], b[j]) <= 0)) x = a[i++];
+    else x = b[j++];
+    if (!out.length || cmp(out[out.length - 1], x) !== 0) out.push(x);
+  }
+  return out;
+}
+
+// Builds the lookup Set for `b` once so it can be reused across many calls.
+function membership(b) {
+  const s = b instanceof Set ? b : new Set(b);
+  return {
+    has: (x) => s.has(x),
+    intersect: (a) => a.filter((x) => s.has(x)),
+    difference: (a) => a.filter((x) => !s.has(x)),
+  };
+}
+
+function groupByMap(arr, fn) {
+  const m = new Map();
+  for (let i = 0; i < arr.length; i++) {
+    const x = arr[i];
+    const k = fn(x);
+    const bucket = m.get(k);
+    if (bucket) bucket.push(x);
+    else m.set(k, [x]);
+  }
+  return m;
+}
+
+function keyByMap(arr, fn) {
+  const m = new Map();
+  for (let i = 0; i < arr.length; i++) m.set(fn(arr[i]), arr[i]);
+  return m;
+}
+
+// Read-only window over an array: no elements are copied until toArray().
+class View {
+  constructor(source, start = 0, length = source.length - start, shift = 0) {
+    this.source = source;
+    this.start = start;
+    this.length = Math.max(0, length);
+    this.shift = shift;
+  }
+
+  get(i) {
+    if (i < 0 || i >= this.length) return undefined;
+    return this.source[this.start + ((i + this.shift) % this.length)];
+  }
+
+  *[Symbol.iterator]() {
+    for (let i = 0; i < this.length; i++) yield this.get(i);
+  }
+
+  toArray() {
+    const out = new Array(this.length);
+    for (let i = 0; i < this.length; i++) out[i] = this.get(i);
+    return out;
+  }
+}
+
+// Resolves an index the way Array.prototype.slice does
+function clampIndex(n, len) {
+  n = Math.trunc(Number(n)) || 0;
+  if (n < 0) return Math.max(0, len + n);
+  return Math.min(len, n);
+}
+
+function takeView(arr, n) {
+  return new View(arr, 0, n === undefined ? arr.length : clampIndex(n, arr.length));
+}
+
+function dropView(arr, n) {
+  const start = clampIndex(n, arr.length);
+  return new View(arr, start, arr.length - start);
+}
+
+// Same element order as array.rotate(arr, k)
+function rotateView(arr, k) {
+  const n = arr.length;
+  if (!n) return new View(arr, 0, 0);
+  k = ((k % n) + n) % n;
+  return new View(arr, 0, n, (n - k) % n);
+}
+
+function toFloat64(arr) {
+  return arr instanceof Float64Array ? arr : Float64Array.from(arr);
+}
+
+function sumNumeric(arr) {
+  let s = 0;
+  for (let i = 0; i < arr.length; i++) s += arr[i];
+  return s;
+}
+
+function averageNumeric(arr) {
+  return arr.length ? sumNumeric(arr) / arr.length : 0;
+}
+
+// k-th smallest element of a (mutated in place), Hoare-style quickselect.
+function select(a, k) {
+  let lo = 0,
+    hi = a.length - 1;
+  while (lo < hi) {
+    const pivot = a[(lo + hi) >>> 1];
+    let i = lo,
+      j = hi;
+    while (i <= j) {
+      while (a[i] < pivot) i++;
+      while (a[j] > pivot) j--;
+      if (i <= j) {
+        const t = a[i];
+        a[i] = a[j];
+        a[j] = t;
+        i++;
+        j--;
+      }
+    }
+    if (k <= j) hi = j;
+    else if (k >= i) lo = i;
+    else break;
+  }
+  return a[k];
+}
+
+// Median of NaN-free numeric data in O(n) via quickselect on a Float64Array copy.
+function medianNumeric(arr) {
+  const n = arr.length;
+  if (!n) return 0;
+  const a = Float64Array.from(arr);
+  const m = n >> 1;
+  const hi = select(a, m);
+  if (n % 2) return hi;
+  let lo = -Infinity;
+  for (let i = 0; i < m; i++) if (a[i] > lo) lo = a[i];
+  return (lo + hi) / 2;
+}
+
+module.exports = {
+  isNumericArray,
+  flatten,
+  flattenDepth,
+  intersectSorted,
+  differenceSorted,
+  unionSorted,
+  membership,
+  groupByMap,
+  keyByMap,
+  View,
+  takeView,
+  dropView,
+  rotateView,
+  toFloat64,
+  sumNumeric,
+  averageNumeric,
+  medianNumeric,
+};
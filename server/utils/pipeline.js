@@ -0,0 +1,303 @@
+// Compiles a chain of string transforms into a single character scan.
+//
+// Each step is a small state machine over char codes; compiling a chain links
+// them so every character flows through all steps in one pass, without the
+// intermediate strings and repeated regex passes of calling the string.js
+// helpers one after another. The scan handles ASCII input; anything else (and
+// non-string input) runs the original helpers so results are always identical.
+const str = require('./string');
+
+const NON_ASCII = /[^\x00-\x7f]/;
+
+const isSpace = (c) => c === 32 || (c >= 9 && c <= 13);
+const isUpper = (c) => c >= 65 && c <= 90;
+const isLower = (c) => c >= 97 && c <= 122;
+const isDigit = (c) => c >= 48 && c <= 57;
+const lower = (c) => (isUpper(c) ? c + 32 : c);
+const upper = (c) => (isLower(c) ? c - 32 : c);
+
+class Lower {
+  reset() {}
+  push(c) {
+    this.next.push(lower(c));
+  }
+  end() {
+    this.next.end();
+  }
+}
+
+class Upper {
+  reset() {}
+  push(c) {
+    this.next.push(upper(c));
+  }
+  end() {
+    this.next.end();
+  }
+}
+
+class Trim {
+  constructor() {
+    this.held = [];
+    this.reset();
+  }
+  reset() {
+    this.started = false;
+    this.held.length = 0;
+  }
+  push(c) {
+    if (isSpace(c)) {
+      if (this.started) this.held.push(c);
+      return;
+    }
+    for (const h of this.held) this.next.push(h);
+    this.held.length = 0;
+    this.started = true;
+    this.next.push(c);
+  }
+  end() {
+    this.next.end();
+  }
+}
+
+// /\s+/g -> ' ', then trim
+class NormalizeWhitespace {
+  constructor() {
+    this.reset();
+  }
+  reset() {
+    this.started = false;
+    this.gap = false;
+  }
+  push(c) {
+    if (isSpace(c)) {
+      this.gap = this.started;
+      return;
+    }
+    if (this.gap) this.next.push(32);
+    this.gap = false;
+    this.started = true;
+    this.next.push(c);
+  }
+  end() {
+    this.next.end();
+  }
+}
+
+// lowercase, split on /\s+/, capitalise each word, join with ' '
+class TitleCase {
+  constructor() {
+    this.reset();
+  }
+  reset() {
+    this.inSpace = false;
+    this.wordStart = true;
+  }
+  push(c) {
+    if (isSpace(c)) {
+      if (!this.inSpace) this.next.push(32);
+      this.inSpace = true;
+      this.wordStart = true;
+      return;
+    }
+    this.inSpace = false;
+    this.next.push(this.wordStart ? upper(c) : lower(c));
+    this.wordStart = false;
+  }
+  end() {
+    this.next.end();
+  }
+}
+
+// Separator between a lowercase and an uppercase letter, runs of whitespace
+// or `joiner` collapse to one separator, then lowercase.
+class Delimit {
+  constructor(sep, joiner) {
+    this.sep = sep;
+    this.joiner = joiner;
+    this.reset();
+  }
+  reset() {
+    this.prevLower = false;
+    this.inRun = false;
+  }
+  push(c) {
+    if (isSpace(c) || c === this.joiner) {
+      if (!this.inRun) this.next.push(this.sep);
+      this.inRun = true;
+      this.prevLower = false;
+      return;
+    }
+    if (this.prevLower && isUpper(c)) this.next.push(this.sep);
+    this.prevLower = isLower(c);
+    this.inRun = false;
+    this.next.push(lower(c));
+  }
+  end() {
+    this.next.end();
+  }
+}
+
+// lowercase, drop [^a-z0-9\s-], trim, then any run of whitespace/'-' -> '-'
+class Slugify {
+  constructor() {
+    this.reset();
+  }
+  reset() {
+    this.started = false;
+    this.run = false;
+    this.dash = false;
+  }
+  push(c) {
+    c = lower(c);
+    if (isSpace(c)) {
+      if (this.started) this.run = true;
+    } else if (c === 45) {
+      this.started = this.run = this.dash = true;
+    } else if (isLower(c) || isDigit(c)) {
+      if (this.run) this.next.push(45);
+      this.run = this.dash = false;
+      this.started = true;
+      this.next.push(c);
+    }
+  }
+  end() {
+    // Trailing whitespace is trimmed but a trailing dash survives
+    if (this.run && this.dash) this.next.push(45);
+    this.next.end();
+  }
+}
+
+const STEPS = {
+  lower: { stage: () => new Lower(), ref: (s) => String(s).toLowerCase() },
+  upper: { stage: () => new Upper(), ref: (s) => String(s).toUpperCase() },
+  trim: { stage: () => new Trim(), ref: (s) => String(s).trim() },
+  normalizeWhitespace: { stage: () => new NormalizeWhitespace(), ref: str.normalizeWhitespace },
+  toTitleCase: { stage: () => new TitleCase(), ref: str.toTitleCase },
+  toKebabCase: { stage: () => new Delimit(45, 95), ref: str.toKebabCase },
+  toSnakeCase: { stage: () => new Delimit(95, 45), ref: str.toSnakeCase },
+  slugify: { stage: () => new Slugify(), ref: str.slugify },
+};
+
+// Output buffers above this size are dropped after the run instead of being
+// kept for the life of the pipeline
+const SINK_KEEP = 64 * 1024;
+
+class Sink {
+  constructor() {
+    this.buf = Buffer.allocUnsafe(256);
+    this.len = 0;
+  }
+  reset(capacity) {
+    if (this.buf.length < capacity) this.buf = Buffer.allocUnsafe(capacity);
+    this.len = 0;
+  }
+  release() {
+    if (this.buf.length > SINK_KEEP) this.buf = Buffer.allocUnsafe(256);
+  }
+  push(c) {
+    if (this.len === this.buf.length) {
+      const grown = Buffer.allocUnsafe(this.buf.length * 2);
+      this.buf.copy(grown);
+      this.buf = grown;
+    }
+    this.buf[this.len++] = c;
+  }
+  end() {}
+  toString() {
+    return this.buf.toString('latin1', 0, this.len);
+  }
+}
+
+// Bounded least-recently-used cache on top of Map insertion order. Besides
+// the entry count, options.maxWeight caps the summed options.weigh(k, v).
+class LRU {
+  constructor(max, options = {}) {
+    this.max = max;
+    this.maxWeight = options.maxWeight || Infinity;
+    this.weigh = options.weigh || (() => 0);
+    this.weight = 0;
+    this.map = new Map();
+  }
+  get(k) {
+    const v = this.map.get(k);
+    if (v !== undefined) {
+      this.map.delete(k);
+      this.map.set(k, v);
+    }
+    return v;
+  }
+  set(k, v) {
+    if (this.max <= 0) return;
+    this.delete(k);
+    const w = this.weigh(k, v);
+    if (w > this.maxWeight) return;
+    this.map.set(k, v);
+    this.weight += w;
+    while (this.map.size > this.max || this.weight > this.maxWeight) this.delete(this.map.keys().next().value);
+  }
+  delete(k) {
+    if (!this.map.has(k)) return;
+    this.weight -= this.weigh(k, this.map.get(k));
+    this.map.delete(k);
+  }
+  get size() {
+    return this.map.size;
+  }
+}
+
+// The memo keeps at most cacheSize entries and cacheChars characters (inputs
+// plus outputs); inputs longer than maxCachedLength are never memoized.
+function compile(steps, options = {}) {
+  const { cacheSize = 1024, cacheChars = 256 * 1024, maxCachedLength = 4096 } = options;
+  if (!Array.isArray(steps) || !steps.length) throw new Error('steps must be a non-empty array');
+  for (const name of steps) {
+    if (!Object.prototype.hasOwnProperty.call(STEPS, name)) throw new Error('unknown transform: ' + name);
+  }
+  const refs = steps.map((name) => STEPS[name].ref);
+  const cache = new LRU(cacheSize, { maxWeight: cacheChars, weigh: (k, v) => k.length + v.length });
+
+  function slow(s) {
+    for (const fn of refs) s = fn(s);
+    return s;
+  }
+
+  // The chain is built once and reset per input; runs are synchronous so
+  // one set of stages per compiled pipeline is enough.
+  const sink = new Sink();
+  const stages = [];
+  let head = sink;
+  for (let i = steps.length - 1; i >= 0; i--) {
+    const stage = STEPS[steps[i]].stage();
+    stage.next = head;
+    head = stage;
+    stages.push(stage);
+  }
+
+  function scan(s) {
+    if (NON_ASCII.test(s)) return slow(s);
+    sink.reset(s.length * 2 + 16);
+    for (const stage of stages) stage.reset();
+    for (let i = 0; i < s.length; i++) head.push(s.charCodeAt(i));
+    head.end();
+    const out = sink.toString();
+    sink.release();
+    return out;
+  }
+
+  function run(s) {
+    if (typeof s !== 'string') return slow(s);
+    if (s.length > maxCachedLength) return scan(s);
+    const hit = cache.get(s);
+    if (hit !== undefined) return hit;
+    const out = scan(s);
+    cache.set(s, out);
+    return out;
+  }
+
+  run.steps = steps.slice();
+  run.cache = cache;
+  return run;
+}
+
+module.exports = { compile, STEPS: Object.keys(STEPS), LRU };
@@ -1,7 +1,7 @@
 import json
 import math
 import time
-import requests
+from mern_client import compat as requests
 
 BASE = "http://localhost:3000"
 
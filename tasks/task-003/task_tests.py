@@ -1,4 +1,4 @@
-import requests
+from mern_client import compat as requests
 from datetime import datetime
 
 BASE = "http://localhost:3000"
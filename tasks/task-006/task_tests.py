@@ -1,5 +1,5 @@
 import time
-import requests
+from mern_client import compat as requests
 
 BASE = "http://localhost:3000"
 
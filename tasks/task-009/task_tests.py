@@ -1,6 +1,6 @@
 import math
 import time
-import requests
+from mern_client import compat as requests
 
 BASE = "http://localhost:3000"
 
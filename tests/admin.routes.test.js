@@ -0,0 +1,91 @@
+const fs = require('fs');
+const os = require('os');
+const path = require('path');
+const request = require('supertest');
+
+// Set before the app loads: timing wrappers are only installed with a token
+const token = 'test-token';
+process.env.ADMIN_TOKEN = token;
+const app = require('../server');
+const compute = require('../server/services/compute');
+
+describe('admin routes', () => {
+  let dir;
+
+  beforeAll(() => {
+    dir = fs.mkdtempSync(path.join(os.tmpdir(), 'profiles-'));
+    process.env.PROFILE_DIR = dir;
+  });
+
+  afterAll(() => {
+    delete process.env.ADMIN_TOKEN;
+    delete process.env.PROFILE_DIR;
+    fs.rmSync(dir, { recursive: true, force: true });
+  });
+
+  beforeEach(() => {
+    process.env.ADMIN_TOKEN = token;
+  });
+
+  test('hidden when no token is configured', async () => {
+    delete process.env.ADMIN_TOKEN;
+    const res = await request(app).get('/admin/timing');
+    expect(res.statusCode).toBe(404);
+  });
+
+  test('rejects a wrong token', async () => {
+    const res = await request(app).get('/admin/timing').set('Authorization', 'Bearer nope');
+    expect(res.statusCode).toBe(401);
+  });
+
+  test('timed cpu profile is written as .cpuprofile', async () => {
+    const res = await request(app).post('/admin/profile/cpu/start?seconds=0.1').set('X-Admin-Token', token);
+    expect(res.statusCode).toBe(200);
+    expect(res.body.file.endsWith('.cpuprofile')).toBe(true);
+    expect(JSON.parse(fs.readFileSync(res.body.file, 'utf8')).nodes.length).toBeGreaterThan(0);
+  });
+
+  test('stop without a running profile is a conflict', async () => {
+    const res = await request(app).post('/admin/profile/cpu/stop').set('X-Admin-Token', token);
+    expect(res.statusCode).toBe(409);
+  });
+
+  test('heap snapshot is written', async () => {
+    const res = await request(app).post('/admin/profile/heap').set('X-Admin-Token', token);
+    expect(res.statusCode).toBe(200);
+    expect(res.body.file.endsWith('.heapsnapshot')).toBe(true);
+    expect(res.body.bytes).toBeGreaterThan(0);
+  }, 30000);
+
+  test('one heap snapshot at a time', async () => {
+    const post = () => request(app).post('/admin/profile/heap').set('X-Admin-Token', token);
+    const codes = (await Promise.all([post(), post()])).map((r) => r.statusCode).sort();
+    expect(codes).toEqual([200, 409]);
+  }, 30000);
+
+  test('an unwritable profile dir fails the request', async () => {
+    const blocker = path.join(dir, 'not-a-dir');
+    fs.writeFileSync(blocker, '');
+    process.env.PROFILE_DIR = path.join(blocker, 'profiles');
+    try {
+      const res = await request(app).post('/admin/profile/heap').set('X-Admin-Token', token);
+      expect(res.statusCode).toBe(500);
+    } finally {
+      process.env.PROFILE_DIR = dir;
+    }
+  });
+
+  test('timing wrappers record calculator calls', async () => {
+    const auth = { Authorization: `Bearer ${token}` };
+    let res = await request(app).post('/admin/timing').set(auth).send({ enabled: true, reset: true });
+    expect(res.body.enabled).toBe(true);
+    await request(app).get('/adv/gcd?a=8&b=12');
+    res = await request(app).get('/admin/timing').set(auth);
+    expect(res.body.stats.gcd.calls).toBe(1);
+    await compute.run('primes', { n: 100 });
+    res = await request(app).get('/admin/timing').set(auth);
+    expect(res.body.stats['compute.primes'].calls).toBe(1);
+    res = await request(app).post('/admin/timing').set(auth).send({ enabled: false });
+    expect(res.body.enabled).toBe(false);
+  });
+});
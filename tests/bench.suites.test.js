@@ -0,0 +1,42 @@
+const { loadSuites, missingCases, expand } = require('../bench/run');
+const harness = require('../bench/harness');
+
+describe('benchmark suites', () => {
+  const suites = loadSuites();
+
+  test('every exported function has a benchmark case', () => {
+    expect(missingCases(suites)).toEqual([]);
+  });
+
+  test('case inputs are deterministic', () => {
+    const [c] = expand(suites.find((s) => s.name === 'array'));
+    expect(c.args()).toEqual(c.args());
+  });
+
+  test('harness reports a confidence interval', () => {
+    const r = harness.run((x) => x + 1, [1], { warmupMs: 1, sampleMs: 1, samples: 3 });
+    expect(r.ops).toBeGreaterThan(0);
+    expect(r.low).toBeLessThanOrEqual(r.ops);
+    expect(r.high).toBeGreaterThanOrEqual(r.ops);
+  });
+
+  test('median interval uses the order-statistic bounds', () => {
+    expect(harness.medianBoundIndex(3)).toBe(0);
+    expect(harness.medianBoundIndex(10)).toBe(2);
+    expect(harness.medianBoundIndex(20)).toBe(6);
+  });
+
+  test('a slow first call does not pin the batch size', () => {
+    let first = true;
+    const fn = (x) => {
+      if (first) {
+        first = false;
+        const end = Date.now() + 30;
+        while (Date.now() < end);
+      }
+      return x + 1;
+    };
+    const r = harness.run(fn, [1], { warmupMs: 1, sampleMs: 1, samples: 3 });
+    expect(r.iterations).toBeGreaterThan(1);
+  });
+});
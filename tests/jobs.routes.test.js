@@ -0,0 +1,130 @@
+const fs = require('fs');
+const os = require('os');
+const path = require('path');
+const request = require('supertest');
+const app = require('../server');
+const { JobManager } = require('../server/services/jobs');
+const { MemoryStore, DiskStore } = require('../server/services/results');
+
+const delay = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+
+async function waitFor(id, statuses) {
+  for (let i = 0; i < 200; i++) {
+    const res = await request(app).get(`/jobs/${id}`);
+    if (statuses.includes(res.body.status)) return res.body;
+    await delay(10);
+  }
+  throw new Error('job did not finish');
+}
+
+describe('jobs api', () => {
+  test('submit, poll and page through a result', async () => {
+    const sub = await request(app).post('/jobs').send({ op: 'primes', args: { n: 100 } });
+    expect(sub.statusCode).toBe(202);
+    expect(sub.headers.location).toBe(`/jobs/${sub.body.id}`);
+    const job = await waitFor(sub.body.id, ['succeeded']);
+    expect(job.result.total).toBe(25);
+    const page = await request(app).get(`/jobs/${job.id}/result?offset=2&limit=3`);
+    expect(page.body).toMatchObject({ total: 25, offset: 2, limit: 3, items: [5, 7, 11] });
+  });
+
+  test('streams a result as ndjson', async () => {
+    const sub = await request(app).post('/jobs').send({ op: 'permutations', args: { items: [1, 2, 3] } });
+    await waitFor(sub.body.id, ['succeeded']);
+    const res = await request(app).get(`/jobs/${sub.body.id}/stream`);
+    expect(res.headers['content-type']).toMatch(/application\/x-ndjson/);
+    const lines = res.text.trim().split('\n').map((l) => JSON.parse(l));
+    expect(lines).toHaveLength(6);
+    expect(lines[0]).toEqual([1, 2, 3]);
+  });
+
+  test('running jobs can be cancelled', async () => {
+    const sub = await request(app).post('/jobs').send({ op: 'primes', args: { n: 1e8 } });
+    await delay(20);
+    const res = await request(app).post(`/jobs/${sub.body.id}/cancel`);
+    expect(res.statusCode).toBe(200);
+    const job = await waitFor(sub.body.id, ['cancelled']);
+    expect(job.status).toBe('cancelled');
+    const result = await request(app).get(`/jobs/${sub.body.id}/result`);
+    expect(result.statusCode).toBe(409);
+  });
+
+  test('failures are reported on the job', async () => {
+    const sub = await request(app).post('/jobs').send({ op: 'factorial', args: { n: -1 } });
+    const job = await waitFor(sub.body.id, ['failed']);
+    expect(job.error).toBe('neg');
+  });
+
+  test('rejects jobs whose result cannot fit in the store', async () => {
+    let res = await request(app).post('/jobs').send({ op: 'primes', args: { n: 1e12 } });
+    expect(res.statusCode).toBe(400);
+    expect(res.body.error).toBe('result too large');
+    res = await request(app).post('/jobs').send({ op: 'permutations', args: { items: [0, 1, 2, 3, 4, 5, 6, 7, 8, 9] } });
+    expect(res.statusCode).toBe(400);
+  });
+
+  test('validates submissions and ids', async () => {
+    let res = await request(app).post('/jobs').send({ op: 'nope' });
+    expect(res.statusCode).toBe(400);
+    res = await request(app).post('/jobs').send({ op: 'primes', args: { n: 'x' } });
+    expect(res.body.error).toBe('args');
+    res = await request(app).get('/jobs/missing');
+    expect(res.statusCode).toBe(404);
+  });
+});
+
+describe('job manager', () => {
+  test('a job removed while its result is stored leaves nothing behind', async () => {
+    class SlowStore extends MemoryStore {
+      async put(id, value) {
+        await delay(30);
+        return super.put(id, value);
+      }
+    }
+    const store = new SlowStore();
+    const manager = new JobManager({ store, run: async () => 42 });
+    const job = manager.submit('factorial', { n: 5 });
+    await delay(10);
+    expect(manager.remove(job.id)).toBe(true);
+    await delay(40);
+    expect(store.has(job.id)).toBe(false);
+  });
+
+  test('stops a run once its output passes the store cap', async () => {
+    const manager = new JobManager({ store: new MemoryStore({ maxBytes: 150000 }) });
+    // pi(100000) = 9592 primes, above the n / ln n estimate of 8686
+    const job = manager.submit('primes', { n: 100000 });
+    for (let i = 0; i < 100 && manager.get(job.id).status !== 'failed'; i++) await delay(10);
+    expect(manager.get(job.id)).toMatchObject({ status: 'failed', error: 'result too large' });
+  });
+});
+
+describe('result stores', () => {
+  test('memory store evicts oldest entries past the size cap', async () => {
+    const store = new MemoryStore({ maxBytes: 2000 });
+    await store.put('a', [1, 2, 3]);
+    await store.put('b', new Array(121).fill(1));
+    expect(store.has('a')).toBe(false);
+    expect(store.has('b')).toBe(true);
+    await expect(store.put('c', new Array(5000).fill(1))).rejects.toThrow(/too large/);
+  });
+
+  test('entries expire after the ttl', async () => {
+    const store = new MemoryStore({ ttlMs: 20 });
+    await store.put('a', 1);
+    await delay(30);
+    expect(await store.page('a', 0, 1)).toBeNull();
+  });
+
+  test('disk store pages and streams ndjson files', async () => {
+    const dir = fs.mkdtempSync(path.join(os.tmpdir(), 'results-'));
+    const store = new DiskStore({ dir });
+    await store.put('x', [10, 20, 30, 40]);
+    expect((await store.page('x', 1, 2)).items).toEqual([20, 30]);
+    const all = [];
+    for await (const item of store.items('x')) all.push(item);
+    expect(all).toEqual([10, 20, 30, 40]);
+    store.delete('x');
+    fs.rmSync(dir, { recursive: true, force: true });
+  });
+});
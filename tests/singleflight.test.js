@@ -0,0 +1,128 @@
+const fs = require('fs');
+const os = require('os');
+const path = require('path');
+const request = require('supertest');
+const app = require('../server');
+const express = require('express');
+const { SingleFlight } = require('../server/services/singleflight');
+const { coalesce, requestKey } = require('../server/middleware/coalesce');
+const { primesUpTo } = require('../server/services/compute');
+const calculator = require('../server/services/calculator');
+const tables = require('../server/services/tables');
+
+const delay = (ms, value) => new Promise((resolve) => setTimeout(() => resolve(value), ms));
+
+describe('single flight', () => {
+  test('concurrent identical calls share one computation', async () => {
+    const flight = new SingleFlight();
+    let calls = 0;
+    const fn = () => {
+      calls++;
+      return delay(20, 42);
+    };
+    const results = await Promise.all([flight.do('k', fn), flight.do('k', fn), flight.do('k', fn)]);
+    expect(results).toEqual([42, 42, 42]);
+    expect(calls).toBe(1);
+    expect(flight.size).toBe(0);
+  });
+
+  test('errors reach every waiter', async () => {
+    const flight = new SingleFlight();
+    const fn = async () => {
+      await delay(5);
+      throw new Error('boom');
+    };
+    const out = await Promise.allSettled([flight.do('e', fn), flight.do('e', fn)]);
+    expect(out.map((r) => r.reason.message)).toEqual(['boom', 'boom']);
+  });
+
+  test('computation is aborted only after the last waiter leaves', async () => {
+    const flight = new SingleFlight();
+    let aborted = false;
+    const fn = (signal) =>
+      new Promise((resolve) => {
+        signal.addEventListener('abort', () => {
+          aborted = true;
+        });
+        setTimeout(() => resolve(1), 100);
+      });
+    const a = new AbortController();
+    const b = new AbortController();
+    const pa = flight.do('s', fn, { signal: a.signal });
+    const pb = flight.do('s', fn, { signal: b.signal });
+    a.abort();
+    await expect(pa).rejects.toMatchObject({ name: 'AbortError' });
+    expect(aborted).toBe(false);
+    b.abort();
+    await expect(pb).rejects.toMatchObject({ name: 'AbortError' });
+    expect(aborted).toBe(true);
+    expect(flight.size).toBe(0);
+  });
+});
+
+describe('cooperative compute', () => {
+  let dir;
+
+  // A small prime table, so larger n go through the segmented sieve
+  beforeAll(() => {
+    dir = fs.mkdtempSync(path.join(os.tmpdir(), 'tables-'));
+    tables.init({ file: path.join(dir, 'tables.bin'), primeLimit: 1000 });
+  });
+
+  afterAll(() => {
+    tables.reset();
+    fs.rmSync(dir, { recursive: true, force: true });
+  });
+
+  test('segmented sieve matches calculator.primesUpTo', async () => {
+    for (const n of [0, 2, 10.5, 1000, 1001, 65537, 131073, 300000]) {
+      expect(await primesUpTo(n)).toEqual(calculator.primesUpTo(n));
+    }
+  });
+});
+
+describe('coalesced responses', () => {
+  test('concurrent identical requests share one handler run', async () => {
+    const mini = express();
+    let runs = 0;
+    mini.use(coalesce(['/slow']));
+    mini.get('/slow', async (req, res) => {
+      runs++;
+      await delay(50);
+      res.status(201).set('X-Run', String(runs)).json({ n: req.query.n });
+    });
+    const server = mini.listen(0);
+    try {
+      const out = await Promise.all([1, 2, 3].map(() => request(server).get('/slow?n=7')));
+      expect(runs).toBe(1);
+      for (const r of out) {
+        expect(r.status).toBe(201);
+        expect(r.headers['x-run']).toBe('1');
+        expect(r.body).toEqual({ n: '7' });
+      }
+    } finally {
+      server.close();
+    }
+  });
+
+  test('keys keep the raw query spelling', () => {
+    const req = (query) => ({ baseUrl: '/adv', path: '/factorial', query, get: () => undefined });
+    expect(requestKey(req({ n: '5', a: '1' }))).toBe(requestKey(req({ a: '1', n: '5' })));
+    expect(requestKey(req({ n: '5' }))).not.toBe(requestKey(req({ n: '5.0' })));
+  });
+
+  test('concurrent primes requests all get the result', async () => {
+    const [r1, r2] = await Promise.all([request(app).get('/adv/primes?n=30'), request(app).get('/adv/primes?n=30')]);
+    expect(r1.status).toBe(200);
+    expect(r2.body.result).toEqual([2, 3, 5, 7, 11, 13, 17, 19, 23, 29]);
+  });
+
+  test('validation and errors come from the route handlers', async () => {
+    let r = await request(app).get('/adv/primes?n=abc');
+    expect(r.status).toBe(400);
+    expect(r.body.error).toBe('n');
+    r = await request(app).get('/adv/factorial?n=-1');
+    expect(r.status).toBe(400);
+    expect(r.body.error).toBe('neg');
+  });
+});
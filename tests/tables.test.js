@@ -0,0 +1,71 @@
+const fs = require('fs');
+const os = require('os');
+const path = require('path');
+const tables = require('../server/services/tables');
+const calculator = require('../server/services/calculator');
+const compute = require('../server/services/compute');
+
+describe('lookup tables', () => {
+  let dir;
+  let file;
+
+  beforeEach(() => {
+    dir = fs.mkdtempSync(path.join(os.tmpdir(), 'tables-'));
+    file = path.join(dir, 'tables.bin');
+  });
+
+  afterEach(() => {
+    fs.rmSync(dir, { recursive: true, force: true });
+  });
+
+  test('builds once then loads from disk', () => {
+    const built = tables.load({ file, primeLimit: 1000 });
+    expect(built.source).toBe('built');
+    const loaded = tables.load({ file, primeLimit: 1000 });
+    expect(loaded.source).toBe('disk');
+    expect(Array.from(loaded.primes)).toEqual(Array.from(built.primes));
+    expect(Array.from(loaded.factorials)).toEqual(Array.from(built.factorials));
+  });
+
+  test('rejects a corrupted file and rebuilds it', () => {
+    tables.load({ file, primeLimit: 1000 });
+    const buf = fs.readFileSync(file);
+    buf[buf.length - 1] ^= 0xff;
+    expect(tables.parse(buf)).toBeNull();
+    fs.writeFileSync(file, buf);
+    expect(tables.load({ file, primeLimit: 1000 }).source).toBe('built');
+  });
+
+  test('rebuilds when the prime limit changes', () => {
+    tables.load({ file, primeLimit: 1000 });
+    const t = tables.load({ file, primeLimit: 2000 });
+    expect(t.source).toBe('built');
+    expect(t.primes[t.primes.length - 1]).toBe(1999);
+  });
+});
+
+describe('compute lookups', () => {
+  let dir;
+
+  beforeAll(() => {
+    dir = fs.mkdtempSync(path.join(os.tmpdir(), 'tables-'));
+    tables.init({ file: path.join(dir, 'tables.bin'), primeLimit: 1000 });
+  });
+
+  afterAll(() => {
+    tables.reset();
+    fs.rmSync(dir, { recursive: true, force: true });
+  });
+
+  test('factorial and fibonacci match the calculator', () => {
+    for (let n = 0; n < 200; n++) expect(compute.factorial(n)).toBe(calculator.factorial(n));
+    expect(compute.fibonacci(10)).toBe(55);
+    expect(compute.fibonacci(5000)).toBe(Infinity);
+    expect(compute.factorial(2.5)).toBe(2);
+  });
+
+  test('primes within the limit come from the table', async () => {
+    expect(await compute.primesUpTo(20)).toEqual([2, 3, 5, 7, 11, 13, 17, 19]);
+    expect(await compute.primesUpTo(1000)).toEqual(calculator.primesUpTo(1000));
+  });
+});
@@ -0,0 +1,180 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from mern_client import ApiError, AsyncClient, Client
+from mern_client import client as client_module
+from mern_client.batching import Batcher
+
+
+class StubServer:
+    """Local HTTP server; ``responses[path]`` is a list of (status, headers, body)
+    answers used in turn, the last one repeating."""
+
+    def __init__(self):
+        self.responses = {}
+        self.requests = []
+        self.lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _answer(self):
+                url = urlparse(self.path)
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length)) if length else None
+                with stub.lock:
+                    stub.requests.append((self.command, url.path, parse_qs(url.query), body))
+                    answers = stub.responses.get(url.path) or [(404, {}, {"error": "not found"})]
+                    status, headers, payload = answers.pop(0) if len(answers) > 1 else answers[0]
+                if callable(payload):
+                    payload = payload(body)
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_GET = _answer
+            do_POST = _answer
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = "http://127.0.0.1:%d" % self.httpd.server_address[1]
+        self.thread = threading.Thread(target=self.httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+        self.thread.start()
+
+    def calls(self, path):
+        with self.lock:
+            return [r for r in self.requests if r[1] == path]
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def server():
+    stub = StubServer()
+    yield stub
+    stub.close()
+
+
+def test_retries_503_honouring_retry_after(server, monkeypatch):
+    """503 responses are retried, sleeping for Retry-After instead of the backoff"""
+    sleeps = []
+    monkeypatch.setattr(client_module.time, "sleep", sleeps.append)
+    server.responses["/api/add"] = [
+        (503, {"Retry-After": "2"}, {"error": "busy"}),
+        (503, {"Retry-After": "0"}, {"error": "busy"}),
+        (200, {}, {"result": 3}),
+    ]
+    with Client(base_url=server.url, backoff=10) as c:
+        assert c.add(1, 2) == 3
+    assert sleeps == [2.0, 0.0]
+    assert len(server.calls("/api/add")) == 3
+
+
+def test_retries_stop_after_the_limit(server, monkeypatch):
+    """the last 503 is returned once retries run out, with exponential backoff between"""
+    sleeps = []
+    monkeypatch.setattr(client_module.time, "sleep", sleeps.append)
+    server.responses["/api/add"] = [(503, {}, {"error": "busy"})]
+    with Client(base_url=server.url, retries=2, backoff=0.1) as c:
+        with pytest.raises(ApiError) as info:
+            c.add(1, 2)
+    assert info.value.status == 503
+    assert info.value.error == "busy"
+    assert len(server.calls("/api/add")) == 3
+    assert 0.05 <= sleeps[0] <= 0.1 and 0.1 <= sleeps[1] <= 0.2
+
+
+def test_batcher_flushes_at_max_size():
+    """a batch reaching max_size is sent at once, without waiting for the window"""
+    batches = []
+    b = Batcher(lambda key, items: batches.append((key, list(items))) or [i * 2 for i in items], window=60, max_size=3)
+    futures = [b.submit("k", i) for i in range(3)]
+    assert [f.result(timeout=1) for f in futures] == [0, 2, 4]
+    assert batches == [("k", [0, 1, 2])]
+
+
+def test_batcher_flushes_after_window():
+    """items below max_size are sent together once the window has passed"""
+    batches = []
+    b = Batcher(lambda key, items: batches.append((key, list(items))) or list(items), window=0.02, max_size=100)
+    first = b.submit("a", 1)
+    second = b.submit("a", 2)
+    other = b.submit("b", 3)
+    assert not first.done()
+    assert (first.result(timeout=1), second.result(timeout=1), other.result(timeout=1)) == (1, 2, 3)
+    assert sorted(batches) == [("a", [1, 2]), ("b", [3])]
+
+
+def test_batcher_errors_reach_every_waiter():
+    """a failing flush, or one returning the wrong number of results, fails every future"""
+    def boom(key, items):
+        raise ValueError("boom")
+
+    b = Batcher(boom, window=60, max_size=2)
+    futures = [b.submit("k", 1), b.submit("k", 2)]
+    for f in futures:
+        with pytest.raises(ValueError, match="boom"):
+            f.result(timeout=1)
+
+    short = Batcher(lambda key, items: [], window=60, max_size=2)
+    futures = [short.submit("k", 1), short.submit("k", 2)]
+    for f in futures:
+        with pytest.raises(RuntimeError, match="0 results for 2 items"):
+            f.result(timeout=1)
+
+
+def test_concurrent_transforms_share_a_request(server):
+    """transform_one calls with the same steps are sent as one /api/transform batch"""
+    server.responses["/api/transform"] = [(200, {}, lambda body: {"results": [s.upper() for s in body["inputs"]]})]
+    with Client(base_url=server.url, batch_window=0.05) as c:
+        out = c.map(lambda s: c.transform_one(["upper"], s), ["a", "b", "c"])
+    assert out == ["A", "B", "C"]
+    calls = server.calls("/api/transform")
+    assert len(calls) == 1
+    assert sorted(calls[0][3]["inputs"]) == ["a", "b", "c"]
+
+
+def test_async_client_gathers_calls(server):
+    """AsyncClient runs calls concurrently on the client's pool"""
+    server.responses["/api/mul"] = [(200, {}, {"result": 6})]
+    server.responses["/adv/gcd"] = [(400, {}, {"error": "a"})]
+
+    async def main():
+        async with AsyncClient(base_url=server.url) as ac:
+            results = await ac.gather([ac.mul(2, 3), ac.mul(2, 3)])
+            with pytest.raises(ApiError):
+                await ac.gcd(1, 2)
+            return results
+
+    assert asyncio.run(main()) == [6, 6]
+    assert len(server.calls("/api/mul")) == 2
+
+
+def test_async_client_closes_only_its_own_client(server, monkeypatch):
+    """a client passed in stays open; one built by AsyncClient is closed with it"""
+    closed = []
+    monkeypatch.setattr(Client, "close", lambda self: closed.append(self))
+    shared = Client(base_url=server.url)
+
+    async def main():
+        async with AsyncClient(shared):
+            pass
+        async with AsyncClient(base_url=server.url) as owned:
+            pass
+        return owned.client
+
+    owned = asyncio.run(main())
+    assert closed == [owned]
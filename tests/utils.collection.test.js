@@ -0,0 +1,59 @@
+const c = require('../server/utils/collection');
+const a = require('../server/utils/array');
+
+describe('collection engine', () => {
+  test('flatten matches the one-level concat semantics', () => {
+    expect(a.flatten([1, [2, [3]], [], 4])).toEqual([1, 2, [3], 4]);
+  });
+
+  test('flattenDepth flattens to the requested depth', () => {
+    expect(c.flattenDepth([1, [2, [3, [4]]]], 2)).toEqual([1, 2, 3, [4]]);
+    expect(c.flattenDepth([1, [2, [3, [4]]]], Infinity)).toEqual([1, 2, 3, 4]);
+  });
+
+  test('sorted set operations merge linearly', () => {
+    expect(c.intersectSorted([1, 2, 2, 4, 6], [2, 3, 6])).toEqual([2, 2, 6]);
+    expect(c.differenceSorted([1, 2, 2, 4, 6], [2, 3, 6])).toEqual([1, 4]);
+    expect(c.unionSorted([1, 3, 5], [2, 3, 6])).toEqual([1, 2, 3, 5, 6]);
+  });
+
+  test('membership reuses one lookup set', () => {
+    const m = c.membership([1, 2, 3]);
+    expect(m.intersect([0, 2, 3])).toEqual([2, 3]);
+    expect(m.difference([0, 2, 3])).toEqual([0]);
+  });
+
+  test('Map-based grouping keeps key types', () => {
+    const g = c.groupByMap([1, 2, 3, 4], (x) => x % 2 === 0);
+    expect(g.get(true)).toEqual([2, 4]);
+    expect(c.keyByMap([{ id: 1 }], (x) => x.id).get(1)).toEqual({ id: 1 });
+  });
+
+  test('views match the copying helpers', () => {
+    const arr = [1, 2, 3, 4, 5];
+    expect(c.rotateView(arr, 2).toArray()).toEqual(a.rotate(arr, 2));
+    expect([...c.takeView(arr, -2)]).toEqual(a.take(arr, -2));
+    expect([...c.dropView(arr, 3)]).toEqual(a.drop(arr, 3));
+    expect(c.rotateView(arr, 1).get(0)).toBe(5);
+  });
+
+  test('numeric median agrees with the sorting median', () => {
+    const nums = Array.from({ length: 501 }, (_, i) => (i * 7919) % 1000);
+    const sorted = nums.slice().sort((x, y) => x - y);
+    expect(c.medianNumeric(nums)).toBe(sorted[250]);
+    expect(a.median([4, 1, 3, 2])).toBe(2.5);
+    expect(c.medianNumeric(new Float64Array([3, 1, 2]))).toBe(2);
+    // -0 takes the sorting path, so the sign of a zero median is preserved
+    expect(Object.is(a.median([0, -0, 1]), -0)).toBe(true);
+    expect(Object.is(a.median([-0, 0, -1]), -0)).toBe(true);
+    expect(a.median([0, 0, 1])).toBe(0);
+  });
+
+  test('array intersect/difference merge sorted numbers like the Set path', () => {
+    expect(a.intersect([1, 2, 2, 4, 6], [2, 3, 6])).toEqual([2, 2, 6]);
+    expect(a.difference([1, 2, 2, 4, 6], [2, 3, 6])).toEqual([1, 4]);
+    expect(a.intersect([-Infinity, 1], [-Infinity, 1])).toEqual([-Infinity, 1]);
+    expect(a.intersect([3, 1, 2], [2, 3])).toEqual([3, 2]);
+    expect(a.difference(['b', 'a'], ['a'])).toEqual(['b']);
+  });
+});
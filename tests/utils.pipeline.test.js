@@ -0,0 +1,79 @@
+const request = require('supertest');
+const app = require('../server');
+const s = require('../server/utils/string');
+const { compile } = require('../server/utils/pipeline');
+
+describe('string pipeline', () => {
+  const samples = [
+    '  Hello   World  ',
+    'fooBar_baz qux',
+    'Crème Brûlée!',
+    ' -- Multi -- Dash -- ',
+    'tabs\tand\nnewlines',
+    '',
+  ];
+
+  test('single steps match the string.js helpers', () => {
+    for (const name of ['slugify', 'toKebabCase', 'toSnakeCase', 'toTitleCase', 'normalizeWhitespace']) {
+      const run = compile([name]);
+      for (const x of samples) expect(run(x)).toBe(s[name](x));
+    }
+  });
+
+  test('chains match applying the helpers in order', () => {
+    const run = compile(['normalizeWhitespace', 'toKebabCase', 'slugify']);
+    for (const x of samples) expect(run(x)).toBe(s.slugify(s.toKebabCase(s.normalizeWhitespace(x))));
+  });
+
+  test('results are memoized in a bounded cache', () => {
+    const run = compile(['toSnakeCase'], { cacheSize: 2 });
+    run('a b');
+    run('c d');
+    run('e f');
+    expect(run.cache.size).toBe(2);
+    expect(run('a b')).toBe('a_b');
+  });
+
+  test('the cache is bounded by characters and skips long inputs', () => {
+    const run = compile(['upper'], { cacheChars: 100, maxCachedLength: 20 });
+    for (let i = 0; i < 10; i++) run('abcdefghij' + i);
+    expect(run.cache.weight).toBeLessThanOrEqual(100);
+    expect(run.cache.size).toBe(4);
+    run('x'.repeat(21));
+    expect(run.cache.get('x'.repeat(21))).toBeUndefined();
+  });
+
+  test('unknown steps are rejected', () => {
+    expect(() => compile(['nope'])).toThrow(/unknown transform/);
+  });
+});
+
+describe('batch transform route', () => {
+  test('transforms every input', async () => {
+    const res = await request(app)
+      .post('/api/transform')
+      .send({ steps: ['slugify'], inputs: ['Hello World', 'Foo  Bar!'] });
+    expect(res.statusCode).toBe(200);
+    expect(res.body.results).toEqual(['hello-world', 'foo-bar']);
+  });
+
+  test('rejects bad steps and inputs', async () => {
+    let res = await request(app).post('/api/transform').send({ steps: ['nope'], inputs: ['x'] });
+    expect(res.statusCode).toBe(400);
+    expect(res.body.error).toBe('steps');
+    res = await request(app).post('/api/transform').send({ steps: ['slugify'], inputs: [1] });
+    expect(res.statusCode).toBe(400);
+    expect(res.body.error).toBe('inputs');
+    res = await request(app).post('/api/transform').send({ steps: new Array(20000).fill('lower'), inputs: ['x'] });
+    expect(res.statusCode).toBe(400);
+    expect(res.body.error).toBe('steps');
+  });
+
+  test('only the batch route accepts bodies past the default limit', async () => {
+    const inputs = new Array(2000).fill('x'.repeat(100));
+    let res = await request(app).post('/api/transform').send({ steps: ['upper'], inputs });
+    expect(res.statusCode).toBe(200);
+    res = await request(app).post('/jobs').send({ op: 'permutations', args: { items: inputs } });
+    expect(res.statusCode).toBe(413);
+  });
+});